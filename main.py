@@ -7,7 +7,7 @@ import pandas as pd
 from playwright.async_api import async_playwright, Playwright, Browser, BrowserContext, Page
 from modules.captcha_solver import CaptchaSolver
 from modules.data_extracter import DataExtracter
-from typing import Set, Optional
+from typing import List, Set, Optional, Tuple
 
 # --- Configuration ---
 # --- Logging setup ---
@@ -28,6 +28,9 @@ TOTAL_WORKERS = 16
 RETRY_WORKERS = 5
 NORMAL_WORKERS = TOTAL_WORKERS - RETRY_WORKERS
 
+# Each worker launches its browser once; its context is replaced after this many projects
+CONTEXT_RECYCLE_EVERY = 50
+
 # --- Column order for the final CSV ---
 DESIRED_ORDER = [
     "project_id", "registration_number", "date_of_registration", "project_name",
@@ -74,14 +77,21 @@ DESIRED_ORDER = [
 csv_lock = asyncio.Lock()
 failed_csv_lock = asyncio.Lock()
 
+# IDs that succeeded on retry; removed from the failed CSV in one pass at shutdown
+recovered_ids: Set[str] = set()
+
+def _append_record(data: dict):
+    df = pd.json_normalize([data])
+    df = df.reindex(columns=DESIRED_ORDER)
+    file_exists = os.path.exists(OUTPUT_FILENAME)
+    df.to_csv(OUTPUT_FILENAME, mode='a', index=False, header=not file_exists)
+
 async def save_record(data: dict):
     """Appends a single successful record to the main CSV file in a thread-safe manner."""
     async with csv_lock:
         try:
-            df = pd.json_normalize([data])
-            df = df.reindex(columns=DESIRED_ORDER)
-            file_exists = os.path.exists(OUTPUT_FILENAME)
-            df.to_csv(OUTPUT_FILENAME, mode='a', index=False, header=not file_exists)
+            # pandas work runs on a thread so the other workers' pages keep moving
+            await asyncio.to_thread(_append_record, data)
         except Exception as e:
             logger.error(f"Failed to save record for {data.get('project_id')}: {e}")
 
@@ -97,16 +107,26 @@ async def log_failed_project(project_id: int, url: str):
         except Exception as e:
             logger.error(f"Failed to log failed project {project_id}: {e}")
 
-def get_processed_ids() -> Set[int]:
-    """Reads both success and failure CSVs to get a set of all IDs that have been attempted."""
-    processed_ids = set()
-    for filename in [OUTPUT_FILENAME, FAILED_PROJECTS_FILENAME]:
-        if os.path.exists(filename):
-            try:
-                df = pd.read_csv(filename, usecols=['project_id'], on_bad_lines='skip')
-                processed_ids.update(df['project_id'].dropna().astype(int).tolist())
-            except (ValueError, KeyError, FileNotFoundError) as e:
-                logger.warning(f"Could not read project_id column from {filename}. It might be empty or malformed. Error: {e}")
+def read_failed_ids() -> List[int]:
+    """Reads the failure CSV once; the IDs both count as attempted and seed the retry queue."""
+    if not os.path.exists(FAILED_PROJECTS_FILENAME):
+        return []
+    try:
+        df = pd.read_csv(FAILED_PROJECTS_FILENAME, usecols=['project_id'], on_bad_lines='skip')
+        return df['project_id'].dropna().astype(int).tolist()
+    except (ValueError, KeyError, FileNotFoundError) as e:
+        logger.warning(f"Could not read project_id column from {FAILED_PROJECTS_FILENAME}. It might be empty or malformed. Error: {e}")
+        return []
+
+def get_processed_ids(failed_ids: List[int]) -> Set[int]:
+    """Combines the success CSV's IDs with the already-read failed IDs into the set of attempted IDs."""
+    processed_ids = set(failed_ids)
+    if os.path.exists(OUTPUT_FILENAME):
+        try:
+            df = pd.read_csv(OUTPUT_FILENAME, usecols=['project_id'], on_bad_lines='skip')
+            processed_ids.update(df['project_id'].dropna().astype(int).tolist())
+        except (ValueError, KeyError, FileNotFoundError) as e:
+            logger.warning(f"Could not read project_id column from {OUTPUT_FILENAME}. It might be empty or malformed. Error: {e}")
     return processed_ids
 
 # ---------------- FIXED function with boolean return for reliability ----------------
@@ -151,25 +171,33 @@ async def process_single_project(page: Page, captcha_solver: CaptchaSolver, data
 
 # ---------------- Helper functions for retry system ----------------
 async def remove_from_failed(project_id: int):
-    """Remove a project ID from failed CSV after a successful retry."""
+    """Mark a project ID as recovered; it is dropped from the failed CSV by compact_failed_file()."""
     async with failed_csv_lock:
-        if not os.path.exists(FAILED_PROJECTS_FILENAME):
-            return
-        try:
-            rows = []
-            fieldnames = ['project_id', 'url']
-            with open(FAILED_PROJECTS_FILENAME, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames or fieldnames
-                for row in reader:
-                    if str(row.get('project_id')) != str(project_id):
-                        rows.append(row)
-            with open(FAILED_PROJECTS_FILENAME, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
-        except Exception as e:
-            logger.error(f"Error removing project {project_id} from failed list: {e}")
+        recovered_ids.add(str(project_id))
+
+def compact_failed_file():
+    """Rewrite the failed CSV once without recovered IDs (atomic replace), instead of once per retry success."""
+    if not recovered_ids or not os.path.exists(FAILED_PROJECTS_FILENAME):
+        return
+    try:
+        rows = []
+        fieldnames = ['project_id', 'url']
+        with open(FAILED_PROJECTS_FILENAME, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or fieldnames
+            for row in reader:
+                if str(row.get('project_id')) not in recovered_ids:
+                    rows.append(row)
+        tmp_path = f"{FAILED_PROJECTS_FILENAME}.tmp"
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, FAILED_PROJECTS_FILENAME)
+        logger.info(f"Removed {len(recovered_ids)} recovered projects from the failed list.")
+        recovered_ids.clear()
+    except Exception as e:
+        logger.error(f"Error compacting failed list: {e}")
 
 async def log_failed_and_enqueue(project_id: int, url: str, retry_queue: asyncio.Queue):
     """Append to failed CSV and push ID to retry queue."""
@@ -177,19 +205,39 @@ async def log_failed_and_enqueue(project_id: int, url: str, retry_queue: asyncio
     await retry_queue.put(project_id)
 
 # ---------------- NEW workers: normal + retry ----------------
+async def open_worker_page(browser: Browser) -> Tuple[BrowserContext, Page]:
+    """New context and page with images, fonts and media blocked; the browser itself lives for the whole worker."""
+    context: BrowserContext = await browser.new_context(
+        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36',
+        service_workers="block"  # keep every request visible to page.route below
+    )
+    page: Page = await context.new_page()
+    # Stylesheets must load: DataExtracter's tab/accordion handling relies on visibility
+    await page.route("**/*", lambda route: route.abort()
+                     if route.request.resource_type in ["image", "font", "media"]
+                     else route.continue_())
+    return context, page
+
+async def recycle_if_due(browser: Browser, context: BrowserContext, page: Page, handled: int) -> Tuple[BrowserContext, Page]:
+    """Swap in a fresh context every CONTEXT_RECYCLE_EVERY projects so per-page objects are released."""
+    if handled and handled % CONTEXT_RECYCLE_EVERY == 0:
+        # Open the replacement first; if that fails the worker keeps its live context
+        new_context, new_page = await open_worker_page(browser)
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing recycled context: {e}")
+        return new_context, new_page
+    return context, page
+
 async def normal_worker(playwright: Playwright, project_queue: asyncio.Queue, retry_queue: asyncio.Queue,
                         captcha_solver: CaptchaSolver, data_extracter: DataExtracter):
     """Processes fresh IDs. On failure, logs + enqueues for retry."""
     browser: Optional[Browser] = None
     try:
         browser = await playwright.firefox.launch(headless=True)
-        context: BrowserContext = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36'
-        )
-        page: Page = await context.new_page()
-        await page.route("**/*", lambda route: route.abort()
-                         if route.request.resource_type in ["image", "stylesheet", "font", "media"]
-                         else route.continue_())
+        context, page = await open_worker_page(browser)
+        handled = 0
 
         while True:
             project_id = await project_queue.get()
@@ -197,6 +245,8 @@ async def normal_worker(playwright: Playwright, project_queue: asyncio.Queue, re
             logger.info(f"[NORMAL] Processing project ID: {project_id}")
 
             try:
+                context, page = await recycle_if_due(browser, context, page, handled)
+                handled += 1
                 # FIX: Check the reliable boolean status instead of file line count
                 is_successful = await process_single_project(page, captcha_solver, data_extracter, project_id, url)
                 if not is_successful:
@@ -219,13 +269,8 @@ async def retry_worker(playwright: Playwright, retry_queue: asyncio.Queue,
     browser: Optional[Browser] = None
     try:
         browser = await playwright.firefox.launch(headless=True)
-        context: BrowserContext = await browser.new_context(
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36'
-        )
-        page: Page = await context.new_page()
-        await page.route("**/*", lambda route: route.abort()
-                         if route.request.resource_type in ["image", "stylesheet", "font", "media"]
-                         else route.continue_())
+        context, page = await open_worker_page(browser)
+        handled = 0
 
         while True:
             project_id = await retry_queue.get()
@@ -233,6 +278,8 @@ async def retry_worker(playwright: Playwright, retry_queue: asyncio.Queue,
             logger.info(f"[RETRY] Retrying project ID: {project_id}")
 
             try:
+                context, page = await recycle_if_due(browser, context, page, handled)
+                handled += 1
                 # FIX: Check the reliable boolean status instead of file line count
                 is_successful = await process_single_project(page, captcha_solver, data_extracter, project_id, url)
                 if is_successful:
@@ -259,7 +306,8 @@ async def retry_worker(playwright: Playwright, retry_queue: asyncio.Queue,
 async def main():
     """Main function to set up the scraping environment and run workers in parallel."""
     logger.info("--- Starting MahaRERA Scraper ---")
-    processed_ids = get_processed_ids()
+    failed_ids = read_failed_ids()
+    processed_ids = get_processed_ids(failed_ids)
     logger.info(f"Found {len(processed_ids)} previously attempted projects. They will be skipped.")
 
     project_queue = asyncio.Queue()
@@ -270,15 +318,11 @@ async def main():
         if i not in processed_ids:
             await project_queue.put(i)
 
-    # Preload failed IDs into retry queue from previous runs
-    if os.path.exists(FAILED_PROJECTS_FILENAME):
-        try:
-            df_failed = pd.read_csv(FAILED_PROJECTS_FILENAME, usecols=['project_id'], on_bad_lines='skip')
-            for pid in df_failed['project_id'].dropna().astype(int).tolist():
-                await retry_queue.put(pid)
-            logger.info(f"Loaded {retry_queue.qsize()} IDs from failed list into retry queue.")
-        except Exception as e:
-            logger.warning(f"Failed to preload failed IDs: {e}")
+    # Preload failed IDs into retry queue from previous runs (no second read of the file)
+    if failed_ids:
+        for pid in failed_ids:
+            retry_queue.put_nowait(pid)
+        logger.info(f"Loaded {retry_queue.qsize()} IDs from failed list into retry queue.")
 
     total_to_process = project_queue.qsize()
     logger.info(f"Queued {total_to_process} new projects for scraping.")
@@ -289,33 +333,37 @@ async def main():
     captcha_solver = CaptchaSolver()
     data_extracter = DataExtracter()
 
-    async with async_playwright() as p:
-        tasks = []
-        # Start NORMAL workers
-        for _ in range(NORMAL_WORKERS):
-            tasks.append(asyncio.create_task(
-                normal_worker(p, project_queue, retry_queue, captcha_solver, data_extracter)
-            ))
-        # Start RETRY workers
-        for _ in range(RETRY_WORKERS):
-            tasks.append(asyncio.create_task(
-                retry_worker(p, retry_queue, captcha_solver, data_extracter)
-            ))
-
-        # Wait for the initial queue of projects to be processed
-        await project_queue.join()
+    try:
+        async with async_playwright() as p:
+            tasks = []
+            # Start NORMAL workers
+            for _ in range(NORMAL_WORKERS):
+                tasks.append(asyncio.create_task(
+                    normal_worker(p, project_queue, retry_queue, captcha_solver, data_extracter)
+                ))
+            # Start RETRY workers
+            for _ in range(RETRY_WORKERS):
+                tasks.append(asyncio.create_task(
+                    retry_worker(p, retry_queue, captcha_solver, data_extracter)
+                ))
+
+            # Wait for the initial queue of projects to be processed
+            await project_queue.join()
         
-        # Now, wait for the retry queue to become empty, but with a timeout
-        # to prevent it from running forever if some projects always fail.
-        try:
-            await asyncio.wait_for(retry_queue.join(), timeout=300.0) # 5-minute timeout for retries
-        except asyncio.TimeoutError:
-            logger.warning("Retry queue processing timed out. Some projects might remain in the failed list.")
-
-        # Gracefully cancel all worker tasks
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+            # Now, wait for the retry queue to become empty, but with a timeout
+            # to prevent it from running forever if some projects always fail.
+            try:
+                await asyncio.wait_for(retry_queue.join(), timeout=300.0) # 5-minute timeout for retries
+            except asyncio.TimeoutError:
+                logger.warning("Retry queue processing timed out. Some projects might remain in the failed list.")
+
+            # Gracefully cancel all worker tasks
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        # Recovered IDs leave the failed list even if the run is interrupted
+        compact_failed_file()
 
     logger.info("--- SCRAPING RUN COMPLETE ---")
     logger.info(f"Successful data saved to: {OUTPUT_FILENAME}")
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import time
 from PIL import Image
@@ -16,6 +17,9 @@ class CaptchaSolver:
 
     async def preprocess_image(self, image_bytes):
         """Convert captcha image to binary thresholded form for OCR."""
+        return self._binarize(image_bytes)
+
+    def _binarize(self, image_bytes):
         img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
         img_np = np.array(img)
         gray = cv2.cvtColor(img_np, cv2.COLOR_RGB2GRAY)
@@ -25,7 +29,12 @@ class CaptchaSolver:
 
     async def extract_text(self, image_bytes):
         """Run OCR on captcha image with multiple configs."""
-        processed_img = await self.preprocess_image(image_bytes)
+        # Tesseract is blocking and CPU-bound; running it on a worker thread
+        # lets other records' pages keep progressing while this one is read
+        return await asyncio.to_thread(self._read_text, image_bytes)
+
+    def _read_text(self, image_bytes):
+        processed_img = self._binarize(image_bytes)
         
         configs = [
             '--psm 8 --oem 3 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz',
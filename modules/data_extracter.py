@@ -1,25 +1,403 @@
 import asyncio
+import json
 import re
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 import logging
-from playwright.async_api import Page, expect
+from playwright.async_api import Page, expect, TimeoutError as PlaywrightTimeoutError
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Sub-extractors run after div.form-card is attached, so a missing element is
+# almost always truly absent. Fail fast and retry once with a longer budget.
+FAST_TIMEOUT = 500
+RETRY_TIMEOUT = 2000
+# Optional sections default to a 7s wait; ones the harvest did not see yet
+# still get this long to render before they are given up on
+OPTIONAL_SECTION_TIMEOUT = 7000
+ABSENT_SECTION_TIMEOUT = 2000
+
+ADDRESS_LABELS = ("State/UT", "District", "Taluka", "Village", "Pin Code")
+ADDRESS_KEY_SUFFIXES = tuple(label.lower().replace('/', '_').replace(' ', '_') for label in ADDRESS_LABELS)
+
+PLANNING_LAND_FIELDS = {
+    'final_plot_bearing': "Final Plot bearing No/CTS Number/Survey Number",
+    'total_land_area': "Total Land Area of Approved Layout (Sq. Mts.)",
+    'land_area_applied': "Land Area for Project Applied for this Registration (Sq. Mts)",
+    'permissible_builtup': "Permissible Built-up Area",
+    'sanctioned_builtup': "Sanctioned Built-up Area of the Project applied for Registration",
+    'aggregate_open_space': "Aggregate area(in sq. mts) of recreational open space as per Layout / DP Remarks"
+}
+# For each label, the bold value of the first white-box whose label contains it
+PLANNING_LAND_JS = """(card, labels) => {
+    const boxes = [...card.querySelectorAll('div.white-box')];
+    return labels.map(label => {
+        const wanted = label.toLowerCase();
+        const box = boxes.find(b => [...b.querySelectorAll('label')].some(l => l.textContent.toLowerCase().includes(wanted)));
+        const value = box && box.querySelector('div.text-font.f-w-700');
+        return value ? value.textContent.trim() : null;
+    });
+}"""
+
+PROJECT_DETAIL_FIELDS = {
+    'project_name': "Project Name",
+    'project_type': "Project Type",
+    'project_location': "Project Location",
+    'proposed_completion_date': "Proposed Completion Date (Original)"
+}
+EXTENSION_DATE_LABEL = "Proposed Completion Date (Revised)"
+PROJECT_DETAILS_ARG = [list(PROJECT_DETAIL_FIELDS.items()), EXTENSION_DATE_LABEL]
+
+# Mirrors div:text-is(label) -> following-sibling::div[1] for every field,
+# plus the Project Status badge, in one pass over the document.
+PROJECT_DETAILS_JS = """([fields, extLabel]) => {
+    const norm = t => (t || '').replace(/\\s+/g, ' ').trim();
+    const divs = [...document.querySelectorAll('div')];
+    const valueAfter = label => {
+        const labelDiv = divs.find(d => norm(d.textContent) === label
+            && ![...d.children].some(c => norm(c.textContent) === label));
+        let value = labelDiv && labelDiv.nextElementSibling;
+        while (value && value.tagName !== 'DIV') value = value.nextElementSibling;
+        return value ? value.innerText.trim() : null;
+    };
+    const out = {};
+    for (const [key, label] of fields) out[key] = valueAfter(label);
+    out.extension_date = valueAfter(extLabel);
+    const statusLabel = [...document.querySelectorAll('span')].find(s => norm(s.textContent) === 'Project Status');
+    const statusRow = statusLabel && statusLabel.parentElement && statusLabel.parentElement.parentElement;
+    let statusBox = statusRow && statusRow.nextElementSibling;
+    while (statusBox && statusBox.tagName !== 'DIV') statusBox = statusBox.nextElementSibling;
+    const statusSpan = statusBox && statusBox.querySelector('span');
+    out.project_status = statusSpan ? statusSpan.innerText.trim() : null;
+    return out;
+}"""
+
+# Placeholder row text such as "No Data Found", "No-Data-Found" or "No record found"
+# (word-bounded, so names like "Casino Data Ltd" or "Juno Recordings" do not match)
+EMPTY_TABLE_RE = re.compile(r"\bno[\s-]+(data|records?)\b", re.I)
+
+
+def _is_empty_sentinel(text: Optional[str]) -> bool:
+    return bool(text) and EMPTY_TABLE_RE.search(text) is not None
+
+
+FORM_DATE_FORMAT = '%d/%m/%Y, %I:%M %p'
+
+
+def _form_date_sort_key(value: str) -> Tuple[int, ...]:
+    """Sortable (y, m, d, H, M) key for a 'dd/mm/yyyy, hh:mm AM' timestamp; slices the canonical layout, strptime otherwise."""
+    fields = None
+    if len(value) == 20 and value[2] == value[5] == '/' and value[10:12] == ', ' and value[14] == ':' and value[17] == ' ':
+        fields = (value[:2], value[3:5], value[6:10], value[12:14], value[15:17])
+        # int() would also take signs and spaces ("-1", " 5"); only plain digits qualify
+        if not all(f.isascii() and f.isdigit() for f in fields):
+            fields = None
+    if fields is not None:
+        meridiem = value[18:].upper()
+        day, month, hour, minute = int(fields[0]), int(fields[1]), int(fields[3]), int(fields[4])
+        # Anything out of range goes to strptime so it raises as before; days past
+        # the 28th also go there so e.g. 31/02 is rejected by the calendar check
+        if meridiem in ("AM", "PM") and 1 <= day <= 28 and 1 <= month <= 12 and 1 <= hour <= 12 and minute <= 59:
+            hour = hour % 12 + (12 if meridiem == "PM" else 0)
+            return (int(fields[2]), month, day, hour, minute)
+    parsed = datetime.strptime(value, FORM_DATE_FORMAT)
+    return (parsed.year, parsed.month, parsed.day, parsed.hour, parsed.minute)
+
+
+def _normalize_header(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+BUILDING_HEADER_KEY_MAP = {
+    "Identification of Building/ Wing as per Sanctioned Plan": "building_identification_plan",
+    "Identification of Wing as per Sanctioned Plan": "wing_identification_plan",
+    "Number of Sanctioned Floors (Including Basement+ Stilt+ Podium+ Service+ Habitable excluding terrace)": "sanctioned_floors",
+    "Total No. of Building Sanctioned Habitable Floor": "sanctioned_habitable_floors",
+    "Sanctioned Apartments / Unit (NR+R)": "sanctioned_apartments",
+    "CC Issued up-to (No. of Floors)": "cc_issued_floors",
+    "View": "view_document_available"
+}
+NORMALIZED_BUILDING_HEADER_MAP = {_normalize_header(k): v for k, v in BUILDING_HEADER_KEY_MAP.items()}
+BUILDING_KEYS = tuple(BUILDING_HEADER_KEY_MAP.values())
+
+APARTMENT_SUMMARY_HEADER_MAP = {
+    "Identification of Building/ Wing as per Sanctioned Plan": "summary_identification_building_wing",
+    "Identification of Wing as per Sanctioned Plan": "summary_identification_wing_plan",
+    "Floor Type": "summary_floor_type",
+    "Total No. Of Residential Apartments/ Units": "summary_total_no_of_residential_apartments",
+    "Total No. Of Non-Residential Apartments/ Units": "summary_total_no_of_non_residential_apartments",
+    "Total Apartments / Unit (NR+R)": "summary_total_no_of_apartments_nr_r",
+    "Total No. of Sold Units": "summary_total_no_of_sold_units",
+    "Total No. of Unsold Units": "summary_total_no_of_unsold_units",
+    "Total No. of Booked": "summary_total_no_of_booked",
+    "Total No. of Rehab Units": "summary_total_no_of_rehab_units",
+    "Total No. of Mortgage": "summary_total_no_of_mortgage",
+    "Total No. of Reservation": "summary_total_no_of_reservation",
+    "Total No. of Land Owner/ Investor Share (For Sale)": "summary_total_no_of_land_owner_investor_share_sale",
+    "Total No. of Land Owner/ Investor Share (Not For Sale)": "summary_total_no_of_land_owner_investor_share_not_for_sale",
+}
+
+TAB_SELECTOR_MAP = {
+    "Partner Details": "partner_details",
+    "Director Details": "partner_details",  # <-- same logic
+    "Promoter Past Experience": "promoter_past_experience",
+    "Authorised Signatory": "authorised_signatory",
+    "Single Point of Contact":"single_point_of_contact",
+    "Project Professionals": "project_professionals",
+    "SRO Details": "sro_details",
+}
+# Lower-cased once so tab matching does not re-normalise every key per tab
+TAB_MATCH_KEYS = tuple((key.lower(), key) for key in TAB_SELECTOR_MAP)
+SKIP_TABS = [ "Allottee Grievance"]
+
+# Tab -> (cells a row must exceed, [(cell index, output key), ...])
+TAB_COLUMN_KEYS = {
+    "Partner Details": (2, [(1, "partner_name"), (2, "partner_designation")]),
+    "Director Details": (2, [(1, "partner_name"), (2, "partner_designation")]),
+    "Promoter Past Experience": (5, [(1, "promoter_past_project_names"), (4, "promoter_past_project_statuses"), (5, "promoter_past_litigation_statuses")]),
+    "Authorised Signatory": (2, [(1, "authorised_signatory_names"), (2, "authorised_signatory_designations")]),
+    "Single Point of Contact": (2, [(1, "spa_name"), (2, "spa_designation")]),
+    "SRO Details": (2, [(1, "sro_name"), (2, "sro_document_name")]),
+}
+
+# Professional type substring -> output key, checked in order; anything else is "other"
+PROFESSIONAL_TYPE_KEYS = (
+    ("architect", "architect_names"),
+    ("engineer", "engineer_names"),
+    ("chartered accountant", "chartered_accountant_names"),
+)
+
+APARTMENT_SUMMARY_KEYS = (*APARTMENT_SUMMARY_HEADER_MAP.values(), "total_no_of_apartments")
+
+BANK_FIELDS = { "Bank Name": "bank_name", "IFSC Code": "ifsc_code", "Bank Address": "bank_address" }
+
+def _white_box_xpath(title: str) -> str:
+    """Nearest div.white-box around a <b> heading containing title (pure XPath, no :has-text scan)."""
+    return (f"xpath=//b[contains(normalize-space(), '{title}')]"
+            "/ancestor::div[contains(concat(' ', normalize-space(@class), ' '), ' white-box ')][1]")
+
+
+# Walks the Building Details table in-page and returns {header: "cell, cell"},
+# skipping the "#" column and the "Total" row. The View column reports
+# whether the document eye icon is present.
+BUILDING_TABLE_JS = """table => {
+    const headers = [...table.querySelectorAll('thead th')]
+        .map(th => (th.textContent || '').trim())
+        .filter(h => h !== '#');
+    const out = Object.fromEntries(headers.map(h => [h, []]));
+    const isView = headers.map(h => h.split(/\\s+/).join(' ').toLowerCase() === 'view');
+    table.querySelectorAll('tbody tr').forEach(tr => {
+        if ((tr.textContent || '').includes('Total')) return;
+        const tds = [...tr.querySelectorAll('td')].slice(1);
+        headers.forEach((h, i) => {
+            const td = tds[i];
+            if (!td) return;
+            out[h].push(isView[i] ? (td.querySelector('i.bi-eye-fill') ? 'True' : 'False') : (td.textContent || '').trim());
+        });
+    });
+    return Object.fromEntries(Object.entries(out).filter(([, v]) => v.length).map(([h, v]) => [h, v.join(', ')]));
+}"""
+
+# Same walk for Summary of Apartments/Units. Wide tables (>10 headers) are
+# returned as comma-joined columns; the 5-column variant only needs the unit total.
+APARTMENT_SUMMARY_JS = """table => {
+    const ths = [...table.querySelectorAll('thead th')].map(th => (th.textContent || '').trim());
+    const headers = ths.filter(h => h !== '#');
+    const columns = Object.fromEntries(headers.map(h => [h, []]));
+    let unitTotal = 0;
+    table.querySelectorAll('tbody tr').forEach(tr => {
+        const tds = [...tr.querySelectorAll('td')];
+        if (ths.length === 5) {
+            const t = tds.length === 5 ? (tds[4].textContent || '').trim() : '';
+            if (/^[+-]?\\d+$/.test(t)) unitTotal += parseInt(t, 10);
+            return;
+        }
+        if ((tr.textContent || '').includes('Total')) return;
+        tds.slice(1).forEach((td, i) => {
+            if (i < headers.length) columns[headers[i]].push((td.textContent || '').trim());
+        });
+    });
+    const joined = Object.fromEntries(Object.entries(columns).map(([h, v]) => [h, v.join(', ')]));
+    return {headerCount: ths.length, columns: joined, unitTotal};
+}"""
+
+# Per parking table, sums column 7 into open / closed (or covered) totals.
+PARKING_SUMS_JS = """tables => tables.map(table => {
+    let open = 0, closed = 0;
+    table.querySelectorAll('tbody tr').forEach(tr => {
+        const tds = tr.querySelectorAll('td');
+        if (tds.length < 8) return;
+        const parkingType = tds[1].innerText.trim().toLowerCase();
+        const countText = tds[6].innerText.trim();
+        const count = /^\\d+$/.test(countText) ? parseInt(countText, 10) : 0;
+        if (parkingType.includes('open')) open += count;
+        else if (parkingType.includes('closed') || parkingType.includes('covered')) closed += count;
+    });
+    return {open, closed};
+})"""
+
+# [label, value] pairs for every label.form-label, where value is the
+# innerText of the label's first following sibling div (or null).
+LABEL_VALUES_JS = """root => [...root.querySelectorAll('label.form-label')].map(label => {
+    let value = label.nextElementSibling;
+    while (value && value.tagName !== 'DIV') value = value.nextElementSibling;
+    return [(label.textContent || '').trim(), value ? value.innerText.trim() : null];
+})"""
+
+# [label, raw value] for each labelled column of the first labelled row in
+# the Promoter Details fieldset. The value is the first non-blank div/span.
+PROMOTER_DETAILS_JS = """section => {
+    const hasClass = (el, part) => (el.getAttribute('class') || '').includes(part);
+    const row = [...section.querySelectorAll('div')].find(d => hasClass(d, 'row') && d.querySelector('label'));
+    if (!row) return [];
+    return [...row.querySelectorAll('div')]
+        .filter(col => hasClass(col, 'col') && col.querySelector('label'))
+        .map(col => {
+            const label = (col.querySelector('label').textContent || '').trim().replace(/:+$/, '');
+            const valueEl = [...col.querySelectorAll('div, span')].find(el => (el.textContent || '').trim() !== '');
+            return [label, valueEl ? valueEl.textContent.trim() : ''];
+        });
+}"""
+
+# Address values under a section header: for each label, the text of the first
+# div inside the label's next sibling, or null.
+ADDRESS_FIELDS_JS = """(header, [containerSel, labels]) => {
+    const section = header.closest(containerSel);
+    if (!section) return labels.map(() => null);
+    const fieldLabels = [...section.querySelectorAll('label')];
+    return labels.map(l => {
+        const lab = fieldLabels.find(x => x.textContent.includes(l));
+        const div = lab && lab.nextElementSibling && lab.nextElementSibling.querySelector('div');
+        return (div && div.textContent.trim()) || null;
+    });
+}"""
+
+# Litigation answer (lowercased) and tbody row texts of the section's table,
+# both read inside the Litigation Details white-box; rows is null if no table.
+LITIGATION_QUESTION = "Is there any litigation against this proposed project"
+LITIGATION_JS = """(box, question) => {
+    // Whitespace-collapsed, case-insensitive match, as :has-text() did
+    const norm = t => (t || '').replace(/\\s+/g, ' ').trim().toLowerCase();
+    const wanted = norm(question);
+    const holder = [...box.querySelectorAll('div')]
+        .filter(d => norm(d.textContent).includes(wanted) && d.querySelector('label.form-label-preview-text'))
+        .pop();
+    const label = holder && holder.querySelector('label.form-label-preview-text');
+    const table = box.querySelector('div.table-responsive > table');
+    return {
+        answer: label ? label.innerText.trim().toLowerCase() : null,
+        rows: table ? [...table.querySelectorAll('tbody tr')].map(tr => tr.textContent.trim()) : null,
+    };
+}"""
+
+# Checked state of each named div.form-check1 checkbox (exact, whitespace-
+# normalised label match, as :text-is); null where the checkbox is missing.
+CHECKBOX_STATES_JS = """(box, names) => {
+    const norm = t => (t || '').replace(/\\s+/g, ' ').trim();
+    const holders = [...box.querySelectorAll('div.form-check1')];
+    return names.map(name => {
+        const holder = holders.find(d => [...d.querySelectorAll('label')].some(l => norm(l.textContent) === name));
+        const input = holder && holder.querySelector('input[type="checkbox"]');
+        return input ? input.checked : null;
+    });
+}"""
+
+TAB_NAMES_JS = "els => els.map(e => (e.textContent || '').trim())"
+
+# Trimmed text of every cell, row by row (tbody rows unless told otherwise).
+TABLE_ROWS_JS = """(table, rowSelector) => [...table.querySelectorAll(rowSelector || 'tbody tr')].map(
+    tr => [...tr.querySelectorAll('td')].map(td => (td.textContent || '').trim())
+)"""
+
+
+# One pass over the statically rendered sections, reusing the per-section
+# scripts above. A section that is not on the page yet comes back as null.
+# present flags the optional sections whose extractors would otherwise sit
+# out a full timeout on pages that do not have them.
+HARVEST_JS = """() => {
+    const box = title => [...document.querySelectorAll('div.white-box')]
+        .filter(b => [...b.querySelectorAll('b')].some(x => x.textContent.toLowerCase().includes(title)))
+        .pop() || null;
+    const find = (root, sel) => (root ? root.querySelector(sel) : null);
+    const apply = (fn, el) => (el ? fn(el) : null);
+    return {
+        project: (%(project)s)(%(project_arg)s),
+        building: apply(%(building)s, find(box('building details'), 'table')),
+        apartment_summary: apply(%(apartment_summary)s, find(box('summary of apartments/units'), 'table')),
+        bank: apply(%(label_values)s, document.querySelector('project-bank-details-preview fieldset')),
+        complaints: apply(%(table_rows)s, find(box('complaint details'), 'div.table-responsive > table')),
+        present: {
+            investor: [...document.querySelectorAll('label')].some(l => l.textContent.includes('Are there any Investor other than the Promoter')),
+            litigation: box('litigation details') !== null,
+            parking: document.querySelector('div#parkingDetails') !== null,
+            agents: [...document.querySelectorAll('button')].some(b => b.textContent.includes('Registered Agent(s)')),
+        },
+    };
+}""" % {
+    "project": PROJECT_DETAILS_JS,
+    "project_arg": json.dumps(PROJECT_DETAILS_ARG),
+    "building": BUILDING_TABLE_JS,
+    "apartment_summary": APARTMENT_SUMMARY_JS,
+    "label_values": LABEL_VALUES_JS,
+    "table_rows": TABLE_ROWS_JS,
+}
+
+
 class DataExtracter:
+    """Reads a rendered MahaRERA project page into a flat record.
+
+    Everything is read from DOM text, so callers can route-abort image, font
+    and media requests on the page's context before navigating. Stylesheets
+    must load: tab and accordion handling depends on element visibility.
+    """
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    async def extract_project_details(self, page: Page, reg_no: str) -> Optional[Dict[str, Any]]:
-        """Extract comprehensive project details from the MahaRERA project page."""
+    async def _fast_retry(self, action: Callable[[int], Awaitable[T]]) -> T:
+        """Run a timed Playwright call with FAST_TIMEOUT, retrying once with RETRY_TIMEOUT."""
         try:
-            await page.wait_for_selector("div.form-card", timeout=10000)
+            return await action(FAST_TIMEOUT)
+        except PlaywrightTimeoutError:
+            return await action(RETRY_TIMEOUT)
+
+    async def extract_project_details(self, page: Page, reg_no: str, *, ready_selector: str = "div.form-card") -> Optional[Dict[str, Any]]:
+        """
+        Extract comprehensive project details from the MahaRERA project page.
+
+        The caller is expected to have navigated with wait_until='domcontentloaded'
+        and to keep its BrowserContext alive across projects so shared bundles stay
+        cached. Only attachment of ready_selector is awaited here; visibility is not
+        needed for text scraping.
+        """
+        try:
+            await page.wait_for_selector(ready_selector, state="attached", timeout=3000)
             data = {'reg_no': reg_no}
 
+            # Statically rendered sections come back from one in-page pass. A
+            # section the harvest could not find (raw is None, or a missing
+            # project-details label) falls back to its own extractor; a table
+            # that is present but empty is a valid result. The harvest is only a
+            # shortcut: if it fails, every section runs its own extractor
+            try:
+                harvested = await page.evaluate(HARVEST_JS)
+            except Exception as e:
+                self.logger.warning(f"Page harvest failed for {reg_no}, using per-section extractors: {e}")
+                harvested = {}
+            static_sections = {
+                "project": (self._format_project_details, self._extract_project_details_block),
+                "building": (self._format_building_details, self._extract_building_details),
+                "apartment_summary": (self._format_apartment_summary, self._extract_apartment_summary),
+                "bank": (self._format_bank_details, self._extract_bank_details),
+                "complaints": (self._format_complaint_details, self._extract_complaint_details),
+            }
+
             tasks = [
                 self._extract_registration_block(page),
-                self._extract_project_details_block(page),
                 self._extract_planning_authority_block(page),
                 self._extract_planning_land_block(page),
                 self._extract_commencement_certificate(page),
@@ -29,15 +407,29 @@ class DataExtracter:
                 self._extract_all_tab_data(page),
                 self._extract_latest_form_dates(page),
                 self.extract_promoter_landowner_details(page),
-                self._extract_investor_flag(page),
-                self._extract_litigation_details(page),
-                self._extract_building_details(page),
-                self._extract_apartment_summary(page),
-                self._extract_parking_details(page),
-                self._extract_bank_details(page),
-                self._extract_complaint_details(page),
-                self._extract_real_estate_agents(page)
             ]
+            # Optional sections the harvest did not find may still be rendering,
+            # so they run with a short timeout instead of being skipped
+            optional_sections = {
+                "investor": self._extract_investor_flag,
+                "litigation": self._extract_litigation_details,
+                "parking": self._extract_parking_details,
+                "agents": self._extract_real_estate_agents,
+            }
+            present = harvested.get("present") or {}
+            for name, extractor in optional_sections.items():
+                if present.get(name):
+                    tasks.append(extractor(page))
+                else:
+                    self.logger.info(f"Section '{name}' not on page yet for {reg_no}, giving it {ABSENT_SECTION_TIMEOUT}ms")
+                    tasks.append(extractor(page, timeout=ABSENT_SECTION_TIMEOUT))
+            for name, (formatter, fallback) in static_sections.items():
+                raw = harvested.get(name)
+                formatted = formatter(raw) if raw is not None else None
+                if formatted is None:
+                    tasks.append(fallback(page))
+                else:
+                    data.update(formatted)
 
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -55,8 +447,8 @@ class DataExtracter:
 
     async def _extract_registration_block(self, page: Page) -> Dict[str, str]:
         try:
-            reg_number = await page.locator("label[for='yourUsername']:has-text('Registration Number')").locator("xpath=following-sibling::label[1]").inner_text(timeout=5000)
-            reg_date = await page.locator("label[for='yourUsername']:has-text('Date of Registration')").locator("xpath=following-sibling::label[1]").inner_text(timeout=5000)
+            reg_number = await self._fast_retry(lambda t: page.locator("label[for='yourUsername']:has-text('Registration Number')").locator("xpath=following-sibling::label[1]").inner_text(timeout=t))
+            reg_date = await self._fast_retry(lambda t: page.locator("label[for='yourUsername']:has-text('Date of Registration')").locator("xpath=following-sibling::label[1]").inner_text(timeout=t))
 
             result = {
                 'registration_number': reg_number.strip(),
@@ -70,41 +462,13 @@ class DataExtracter:
             return {}
 
     async def _extract_project_details_block(self, page: Page) -> Dict[str, str]:
-        data = {}
-
-        fields = {
-            'project_name': "Project Name",
-            'project_type': "Project Type",
-            'project_location': "Project Location",
-            'proposed_completion_date': "Proposed Completion Date (Original)"
-        }
-
         try:
-            for key, label in fields.items():
-                
-                await page.wait_for_selector("div:has-text('Project Name')", timeout=10000)
-                locator = page.locator(f"div:text-is('{label}')").nth(0)
-                value_locator = locator.locator("xpath=following-sibling::div[1]")
-                value = await value_locator.inner_text(timeout=5000)
-                data[key] = value.strip()
-
-            try:
-                ext_label = "Proposed Completion Date (Revised)"
-                ext_locator = page.locator(f"div:text-is('{ext_label}')").nth(0)
-                ext_value_locator = ext_locator.locator("xpath=following-sibling::div[1]")
-                ext_value = await ext_value_locator.inner_text(timeout=3000)
-                data['extension_date'] = ext_value.strip()
-            except Exception:
-                data['extension_date'] = None
-
-            try:
-                status_label = page.locator("span:text-is('Project Status')").first
-                status_value = await status_label.locator("xpath=../../following-sibling::div[1]//span").inner_text(timeout=3000)
-                data['project_status'] = status_value.strip()
-            except Exception:
-                data['project_status'] = None
-
-            self.logger.info(f"Extracted Project Details: {data}")
+            await self._fast_retry(lambda t: page.locator("div:text-is('Project Name')").first.wait_for(timeout=t))
+            raw = await page.evaluate(PROJECT_DETAILS_JS, PROJECT_DETAILS_ARG)
+            data = self._format_project_details(raw)
+            if data is None:
+                missing = [label for key, label in PROJECT_DETAIL_FIELDS.items() if raw.get(key) is None]
+                raise ValueError(f"labels not found: {missing}")
             return data
 
         except Exception as e:
@@ -112,6 +476,12 @@ class DataExtracter:
             return {}
 
 
+    def _format_project_details(self, raw: Dict[str, Optional[str]]) -> Optional[Dict[str, Optional[str]]]:
+        if any(raw.get(key) is None for key in PROJECT_DETAIL_FIELDS):
+            return None
+        self.logger.info(f"Extracted Project Details: {raw}")
+        return raw
+
     async def _extract_planning_authority_block(self, page: Page) -> Dict[str, Optional[str]]:
         data = {
             "planning_authority": None,
@@ -119,7 +489,7 @@ class DataExtracter:
         }
         try:
             container = page.locator('div.row:has-text("Planning Authority")').first
-            await container.wait_for(timeout=5000)
+            await self._fast_retry(lambda t: container.wait_for(timeout=t))
             try:
                 label_pa = container.locator('span:has-text("Planning Authority")')
                 value_pa_locator = label_pa.locator("xpath=./ancestor::div[contains(@class, 'col-12 text-font')]/following-sibling::div[1]/p").first
@@ -142,36 +512,13 @@ class DataExtracter:
     async def _extract_planning_land_block(self, page: Page) -> Dict[str, Optional[str]]:
         data = {}
         try:
-            field_map = {
-                'final_plot_bearing': "Final Plot bearing No/CTS Number/Survey Number",
-                'total_land_area': "Total Land Area of Approved Layout (Sq. Mts.)",
-                'land_area_applied': "Land Area for Project Applied for this Registration (Sq. Mts)",
-                'permissible_builtup': "Permissible Built-up Area",
-                'sanctioned_builtup': "Sanctioned Built-up Area of the Project applied for Registration",
-                'aggregate_open_space': "Aggregate area(in sq. mts) of recreational open space as per Layout / DP Remarks"
-            }
             section_card = page.locator("div.card-header:has-text('Land Area & Address Details')").first
             form_card = section_card.locator("xpath=ancestor::div[contains(@class, 'form-card')]").first
-            await form_card.wait_for(timeout=5000)
-            white_boxes = form_card.locator("div.white-box")
-            count = await white_boxes.count()
-            for key, expected_label in field_map.items():
-                found = False
-                for i in range(count):
-                    box = white_boxes.nth(i)
-                    try:
-                        label = await box.locator("label").inner_text()
-                        if expected_label.strip() in label.strip():
-                            value_div = box.locator("div.text-font.f-w-700")
-                            await value_div.wait_for(timeout=2000)
-                            value = await value_div.inner_text()
-                            data[key] = value.strip()
-                            found = True
-                            break
-                    except Exception:
-                        continue
-                if not found:
-                    data[key] = None
+            labels = list(PLANNING_LAND_FIELDS.values())
+            values = await self._fast_retry(lambda t: form_card.evaluate(PLANNING_LAND_JS, labels, timeout=t))
+            for (key, expected_label), value in zip(PLANNING_LAND_FIELDS.items(), values):
+                data[key] = value
+                if value is None:
                     self.logger.warning(f"Label '{expected_label}' not found in Planning/Land block.")
             return data
         except Exception as e:
@@ -184,89 +531,42 @@ class DataExtracter:
             section = page.locator("div:has(h5.card-title.mb-0:has-text('Commencement Certificate / NA Order Documents Details'))")
             divOfTable=section.locator("xpath=following-sibling::div[1]");
             table = divOfTable.locator("table:has-text('CC/NA Order Issued to')")
-            await table.wait_for(timeout=5000)
-            rows = table.locator("tbody tr")
-            count = await rows.count()
-            if count == 0 or "No-Data-Found" in (await rows.first.inner_text()):
+            # Every cell in one round-trip; evaluate waits for the table itself
+            rows = await self._fast_retry(lambda t: table.evaluate(TABLE_ROWS_JS, timeout=t))
+            if not rows or _is_empty_sentinel(" ".join(rows[0])):
                 self.logger.info("No Commencement Certificate data found in the table.")
                 return data
-            col2_values, col3_values = [], []
-            for i in range(count):
-                row = rows.nth(i)
-                try:
-                    col2 = await row.locator("td:nth-child(2)").inner_text()
-                    col3 = await row.locator("td:nth-child(3)").inner_text()
-                    col2_values.append(col2.strip())
-                    col3_values.append(col3.strip())
-                except Exception as e:
-                    self.logger.warning(f"Could not process a row in Commencement Certificate table: {e}")
-                    continue
-            data["CC/NA Order Issued to"] = ", ".join(col2_values)
-            data["CC/NA Order in the name of"] = ", ".join(col3_values)
+            # Rows without a 3rd cell are skipped as before
+            full_rows = [cells for cells in rows if len(cells) > 2]
+            data["CC/NA Order Issued to"] = ", ".join(cells[1] for cells in full_rows)
+            data["CC/NA Order in the name of"] = ", ".join(cells[2] for cells in full_rows)
             return data
         except Exception as e:
             self.logger.warning(f"Could not extract Commencement Certificate details: {e}")
             return data
 
-    async def _extract_project_address(self, page: Page) -> Dict[str, str]:
-        target_labels = ["State/UT", "District", "Taluka", "Village", "Pin Code"]
-        results = {}
-
+    async def _scrape_address(self, page: Page, header_text: str, container_selector: str, key_prefix: str) -> Dict[str, Optional[str]]:
+        """Read the address fields under a section header in a single in-page call."""
+        keys = [f"{key_prefix}{suffix}" for suffix in ADDRESS_KEY_SUFFIXES]
         try:
-            header = page.locator("h5.card-title:has-text('Project Address Details')")
-            await header.wait_for(timeout=10000)
-            section = header.locator("xpath=ancestor::div[contains(@class, 'white-box')]")
-
-            for label in target_labels:
-                key_name = f"project_address_{label.lower().replace('/', '_').replace(' ', '_')}"
-                try:
-                    label_locator = section.locator(f"label.form-label:has-text('{label}')")
-                    if not await label_locator.count():
-                        results[key_name] = None
-                        continue
-
-                    value_locator = label_locator.locator("xpath=following-sibling::*[1]")
-                    child_div_locator = value_locator.locator("div")
-
-                    if await child_div_locator.count():
-                        await child_div_locator.first.wait_for(timeout=3000)
-                        value_text = (await child_div_locator.first.text_content() or "").strip()
-                    else:
-                        value_text = None
-
-                    results[key_name] = value_text if value_text else None
-                except Exception:
-                    results[key_name] = None
-
+            header = page.locator(f"xpath=//h5[contains(normalize-space(), '{header_text}')]").first
+            # Locator.evaluate waits for the header itself, so no separate wait_for
+            values = await header.evaluate(ADDRESS_FIELDS_JS, [container_selector, list(ADDRESS_LABELS)], timeout=10000)
+            return dict(zip(keys, values))
         except Exception as e:
-            self.logger.warning(f"Could not extract some location fields: {e}")
-            # Ensure all keys are present in case of complete failure
-            for label in target_labels:
-                key_name = f"project_address_{label.lower().replace('/', '_').replace(' ', '_')}"
-                results.setdefault(key_name, None)
-
-        return results
-
+            self.logger.warning(f"Could not extract address fields under '{header_text}': {e}")
+            return {key: None for key in keys}
 
+    async def _extract_project_address(self, page: Page) -> Dict[str, Optional[str]]:
+        return await self._scrape_address(page, "Project Address Details", "div.white-box", "project_address_")
 
     async def _extract_promoter_details(self, page: Page) -> Dict[str, str]:
         try:
-            header = page.locator("h5.card-title:has-text('Promoter Details')").first
-            await header.wait_for(timeout=10000)
+            header = page.locator("xpath=//h5[contains(@class, 'card-title')][contains(normalize-space(), 'Promoter Details')]").first
             section = header.locator("xpath=ancestor::fieldset[1]")
-            await section.wait_for(timeout=5000)
-            outer_row = section.locator("xpath=.//div[contains(@class,'row')][.//label]").first
-            cols = outer_row.locator("xpath=.//div[contains(@class,'col')][.//label]")
-            total_cols = await cols.count()
+            # Resolve the fieldset once and walk its columns inside that subtree
             details = []
-            for i in range(total_cols):
-                col = cols.nth(i)
-                label_loc = col.locator("label")
-                if await label_loc.count() == 0:
-                    continue
-                label_text = (await label_loc.first.text_content() or "").strip().rstrip(":")
-                value_loc = col.locator("xpath=.//*[self::div or self::span][normalize-space(string(.))!=''][1]")
-                raw_value_text = (await value_loc.first.text_content() or "").strip() if await value_loc.count() > 0 else ""
+            for label_text, raw_value_text in await section.evaluate(PROMOTER_DETAILS_JS, timeout=10000):
                 value_text = raw_value_text.replace(label_text, "").strip()
                 if label_text and value_text:
                     details.append(f"{label_text} - {value_text}")
@@ -276,53 +576,18 @@ class DataExtracter:
             self.logger.warning(f"Could not extract Promoter Details: {e}")
             return {"promoter_details": None}
 
-    async def _extract_promoter_address(self, page: Page) -> Dict[str, str]:
-        address_details = {}
-        try:
-            header = page.locator("h5:has-text('Promoter Official Communication Address')")
-            section = header.locator("xpath=ancestor::fieldset[1]")
-            await section.wait_for(timeout=5000)
-            fields_to_extract = ['State/UT', 'District', 'Taluka', 'Village', 'Pin Code']
-            for field in fields_to_extract:
-                label_locator = section.locator(f"label:has-text('{field}')")
-                value_text = None
-                if await label_locator.count() > 0:
-                    value_locator = label_locator.locator("xpath=./following-sibling::div/div")
-                    if await value_locator.count() > 0:
-                        value_text = (await value_locator.first.text_content() or "").strip()
-                key_suffix = re.sub(r'[^a-z0-9_]', '', field.lower().replace(' ', '_').replace('/', '_'))
-                dict_key = f"promoter_official_communication_address_{key_suffix}"
-                address_details[dict_key] = value_text
-            return address_details
-        except Exception as e:
-            self.logger.warning(f"Could not extract Promoter Address details: {e}")
-            return { f"promoter_official_communication_address_{re.sub(r'[^a-z0-9_]', '', field.lower().replace(' ', '_').replace('/', '_'))}": None for field in fields_to_extract }
+    async def _extract_promoter_address(self, page: Page) -> Dict[str, Optional[str]]:
+        return await self._scrape_address(page, "Promoter Official Communication Address", "fieldset", "promoter_official_communication_address_")
 
     async def _extract_all_tab_data(self, page: Page) -> Dict[str, Any]:
         self.logger.info("--- Starting Robust Sequential Tab Extraction ---")
-        all_tab_data: Dict[str, Any] = {}
-        TAB_SELECTOR_MAP = {
-            "Partner Details": "partner_details",
-            "Director Details": "partner_details",  # <-- same logic
-            "Promoter Past Experience": "promoter_past_experience",
-            "Authorised Signatory": "authorised_signatory",
-            "Single Point of Contact":"single_point_of_contact",
-            "Project Professionals": "project_professionals",
-            "SRO Details": "sro_details",
-        }
-        SKIP_TABS = [ "Allottee Grievance"]
+        parts: Dict[str, List[str]] = defaultdict(list)
         try:
-            tab_buttons = await page.locator(".tabs button").all()
-            self.logger.info(f"Found {len(tab_buttons)} tab buttons.")
+            tab_locator = page.locator(".tabs button")
+            tab_names = await tab_locator.evaluate_all(TAB_NAMES_JS)
+            self.logger.info(f"Found {len(tab_names)} tab buttons.")
 
-            for idx, btn in enumerate(tab_buttons, start=1):
-                try:
-                    raw_name = (await btn.text_content()) or ""
-                except Exception as e:
-                    self.logger.warning(f"Could not get text for tab button #{idx}: {e}")
-                    continue
-
-                tab_name = raw_name.strip()
+            for idx, tab_name in enumerate(tab_names):
                 if not tab_name:
                     continue
 
@@ -330,10 +595,14 @@ class DataExtracter:
                 if any(skip in tab_name for skip in SKIP_TABS):
                     continue
 
-                matched_key = next((k for k in TAB_SELECTOR_MAP if k.lower() in tab_name.lower()), None)
+                lowered_name = tab_name.lower()
+                matched_key = next((k for lowered_key, k in TAB_MATCH_KEYS if lowered_key in lowered_name), None)
                 if not matched_key:
                     continue
 
+                # Only resolve the button for tabs we actually need to open
+                btn = tab_locator.nth(idx)
+
                 # Safe click only if visible & enabled
                 try:
                     if not await btn.is_visible():
@@ -345,127 +614,43 @@ class DataExtracter:
                     self.logger.warning(f"Could not click tab '{tab_name}': {e}")
                     continue
 
-            # for idx, btn in enumerate(tab_buttons, start=1):
-            #     raw_name = (await btn.text_content()) or ""
-            #     tab_name = raw_name.strip()
-            #     if any(skip in tab_name for skip in SKIP_TABS):
-            #         continue
-            #     matched_key = next((k for k in TAB_SELECTOR_MAP if k.lower() in tab_name.lower()), None)
-            #     if not matched_key:
-            #         continue
-            #     try:
-            #         await btn.scroll_into_view_if_needed()
-            #         await btn.click(force=True)
-            #     except Exception as e:
-            #         self.logger.warning(f"Could not click tab button for '{tab_name}': {e}")
-            #         continue
                 try:
                     # Agar Promoter Past Experience hai to extra wait de
                     extra_timeout = 12000 if matched_key == "Promoter Past Experience" else 5000
 
                     tabs_container = btn.locator("xpath=ancestor::div[contains(@class,'tabs')]")
-                    sibling_candidates = [
-                        tabs_container.locator("xpath=following-sibling::div[1]"),
-                        tabs_container.locator("xpath=following-sibling::div[2]")
-                    ]
-                    table_locator = None
-                    for sib in sibling_candidates:
-                        candidate_table = sib.locator("xpath=.//table").first
-                        try:
-                            await candidate_table.wait_for(state="visible", timeout=extra_timeout)
-                            table_locator = candidate_table
-                            break
-                        except:
-                            continue
-                    if table_locator is None:
+                    # One wait covering both candidate panels (the next two sibling
+                    # divs) instead of exhausting the timeout on each in turn
+                    table_locator = tabs_container.locator(
+                        "xpath=following-sibling::div[position() <= 2]//table >> visible=true"
+                    ).first
+                    try:
+                        await table_locator.wait_for(state="visible", timeout=extra_timeout)
+                    except PlaywrightTimeoutError:
                         self.logger.warning(f"No visible table found for tab '{tab_name}'.")
                         continue
 
-                    rows = await table_locator.locator("tbody tr").all() if await table_locator.locator("tbody tr").count() > 0 else await table_locator.locator("tr").all()
-
-                    if matched_key in ["Partner Details", "Director Details"]:
-                        names, desigs = [], []
-                        for row in rows:
-                            cells = await row.locator("td").all()
-                            if len(cells) > 2:
-                                names.append((await cells[1].text_content() or "").strip())
-                                desigs.append((await cells[2].text_content() or "").strip())
-                        all_tab_data["partner_name"] = (all_tab_data.get("partner_name", "") + 
-                                                        (", " if all_tab_data.get("partner_name") else "") +
-                                                        ", ".join(filter(None, names)))
-                        all_tab_data["partner_designation"] = (all_tab_data.get("partner_designation", "") +
-                                                            (", " if all_tab_data.get("partner_designation") else "") +
-                                                            ", ".join(filter(None, desigs)))
-
-                    elif matched_key == "Promoter Past Experience":
-                        names, statuses, litigations = [], [], []
-                        for row in rows:
-                            cells = await row.locator("td").all()
-                            if len(cells) > 5:
-                                names.append((await cells[1].text_content() or "").strip())
-                                statuses.append((await cells[4].text_content() or "").strip())
-                                litigations.append((await cells[5].text_content() or "").strip())
-                        all_tab_data["promoter_past_project_names"] = ", ".join(filter(None, names))
-                        all_tab_data["promoter_past_project_statuses"] = ", ".join(filter(None, statuses))
-                        all_tab_data["promoter_past_litigation_statuses"] = ", ".join(filter(None, litigations))
-
-                    elif matched_key == "Authorised Signatory":
-                        names, desigs = [], []
-                        for row in rows:
-                            cells = await row.locator("td").all()
-                            if len(cells) > 2:
-                                names.append((await cells[1].text_content() or "").strip())
-                                desigs.append((await cells[2].text_content() or "").strip())
-                        all_tab_data["authorised_signatory_names"] = ", ".join(filter(None, names))
-                        all_tab_data["authorised_signatory_designations"] = ", ".join(filter(None, desigs))
-
-
-                    elif matched_key =="Single Point of Contact":
-                        spa_names, spa_desigs = [], []
-                        for row in rows:
-                            cells = await row.locator("td").all()
-                            if len(cells) > 2:
-                                spa_names.append((await cells[1].text_content() or "").strip())
-                                spa_desigs.append((await cells[2].text_content() or "").strip())
-                        all_tab_data["spa_name"] = ", ".join(filter(None, spa_names))
-                        all_tab_data["spa_designation"] = ", ".join(filter(None, spa_desigs))
+                    rows = await table_locator.evaluate(TABLE_ROWS_JS) or await table_locator.evaluate(TABLE_ROWS_JS, "tr")
 
+                    # Column-wise: each output key takes its cell straight from the
+                    # rows, with no per-tab staging lists
+                    if matched_key in TAB_COLUMN_KEYS:
+                        min_cells, columns = TAB_COLUMN_KEYS[matched_key]
+                        full_rows = [cells for cells in rows if len(cells) > min_cells]
+                        for col_idx, key in columns:
+                            parts[key].extend(cells[col_idx] for cells in full_rows if cells[col_idx])
 
                     elif matched_key == "Project Professionals":
-                        architects, engineers, chartered_accountants, others = [], [], [], []
-                        for row in rows:
-                            cells = await row.locator("td").all()
-                            if len(cells) > 2:
-                                prof_type = (await cells[1].text_content() or "").strip().lower()
-                                prof_name = (await cells[2].text_content() or "").strip()
-
-                                if "architect" in prof_type:
-                                    architects.append(prof_name)
-                                elif "engineer" in prof_type:
-                                    engineers.append(prof_name)
-                                elif "chartered accountant" in prof_type:
-                                    chartered_accountants.append(prof_name)
-                                else:
-                                    others.append(prof_name)
-
-                        all_tab_data["architect_names"] = ", ".join(filter(None, architects))
-                        all_tab_data["engineer_names"] = ", ".join(filter(None, engineers))
-                        all_tab_data["chartered_accountant_names"] = ", ".join(filter(None, chartered_accountants))
-                        all_tab_data["other_professional_names"] = ", ".join(filter(None, others))
-
-                    elif matched_key == "SRO Details":
-                        sro_names, doc_names = [], []
-                        for row in rows:
-                            cells = await row.locator("td").all()
-                            if len(cells) > 2:
-                                sro_names.append((await cells[1].text_content() or "").strip())
-                                doc_names.append((await cells[2].text_content() or "").strip())
-                        all_tab_data["sro_name"] = ", ".join(filter(None, sro_names))
-                        all_tab_data["sro_document_name"] = ", ".join(filter(None, doc_names))
+                        buckets = {marker: parts[key] for marker, key in PROFESSIONAL_TYPE_KEYS}
+                        others = parts["other_professional_names"]
+                        for cells in rows:
+                            if len(cells) > 2 and cells[2]:
+                                prof_type = cells[1].lower()
+                                next((bucket for marker, bucket in buckets.items() if marker in prof_type), others).append(cells[2])
 
                 except Exception as e:
                     self.logger.warning(f"Could not process data in tab '{tab_name}': {e}")
-            return all_tab_data
+            return {key: ", ".join(values) for key, values in parts.items()}
         except Exception as e:
             self.logger.error(f"Fatal error during tab extraction: {e}")
             return {}
@@ -479,8 +664,6 @@ class DataExtracter:
             "has_occupancy_certificate": False  # <-- new boolean field
         }
         try:
-            from datetime import datetime
-
             button = page.locator('h2#headingOne >> button[aria-controls="documentLibrary"]')
             await button.wait_for(state="visible", timeout=7000)
 
@@ -490,36 +673,31 @@ class DataExtracter:
                 await button.click()
                 await table.wait_for(state="visible", timeout=5000)
 
-            rows = await table.locator('tbody tr').all()
+            rows = await table.evaluate(TABLE_ROWS_JS)
 
-            # Track latest dates for Form 1, Form 2, Form 5
-            parsed_dates = { "Form 1": None, "Form 2": None, "Form 5": None }
+            # Track (sort_key, raw_string) of the latest Form 1, Form 2, Form 5 entry
+            latest_forms: Dict[str, Optional[Tuple[Tuple[int, ...], str]]] = { "Form 1": None, "Form 2": None, "Form 5": None }
 
-            for row in rows:
-                cells = await row.locator('td').all()
+            for cells in rows:
                 if len(cells) >= 4:
-                    document_type = (await cells[1].text_content() or "").strip()
-                    created_date_str = (await cells[3].text_content() or "").strip()
+                    document_type = cells[1]
+                    created_date_str = cells[3]
 
                     # Check for Occupancy Certificate
                     if "occupancy certificate" in document_type.lower():
                         latest_dates["has_occupancy_certificate"] = True
 
                     try:
-                        current_date = datetime.strptime(created_date_str, '%d/%m/%Y, %I:%M %p')
-                        for form_name in parsed_dates.keys():
-                            if form_name in document_type:
-                                if parsed_dates[form_name] is None or current_date > parsed_dates[form_name]:
-                                    parsed_dates[form_name] = current_date
+                        sort_key = _form_date_sort_key(created_date_str)
                     except ValueError:
                         continue
+                    for form_name, best in latest_forms.items():
+                        if form_name in document_type and (best is None or sort_key > best[0]):
+                            latest_forms[form_name] = (sort_key, created_date_str)
 
-            if parsed_dates["Form 1"]:
-                latest_dates["latest_form1_date"] = parsed_dates["Form 1"].strftime('%d/%m/%Y, %I:%M %p')
-            if parsed_dates["Form 2"]:
-                latest_dates["latest_form2_date"] = parsed_dates["Form 2"].strftime('%d/%m/%Y, %I:%M %p')
-            if parsed_dates["Form 5"]:
-                latest_dates["latest_form5_date"] = parsed_dates["Form 5"].strftime('%d/%m/%Y, %I:%M %p')
+            for form_name, key in (("Form 1", "latest_form1_date"), ("Form 2", "latest_form2_date"), ("Form 5", "latest_form5_date")):
+                if latest_forms[form_name]:
+                    latest_dates[key] = latest_forms[form_name][1]
 
             return latest_dates
 
@@ -532,65 +710,57 @@ class DataExtracter:
         landowner_data = { "promoter_is_landowner": False, "has_other_landowners": False, "landowner_names": None, "landowner_types": None, "landowner_share_types": None }
         try:
             container = page.locator('div.white-box:has-text("Promoter Landowner")')
-            await container.wait_for(state="visible", timeout=7000)
-            promoter_checkbox = container.locator('div.form-check1:has(label:text-is("Promoter")) input[type="checkbox"]')
-            other_landowners_checkbox = container.locator('div.form-check1:has(label:text-is("Promoter Landowner(s)")) input[type="checkbox"]')
-            landowner_data["promoter_is_landowner"] = await promoter_checkbox.is_checked()
-            landowner_data["has_other_landowners"] = await other_landowners_checkbox.is_checked()
+            # Both checkbox states in one call instead of a locator resolve + is_checked each
+            states = await container.evaluate(CHECKBOX_STATES_JS, ["Promoter", "Promoter Landowner(s)"], timeout=7000)
+            if None in states:
+                raise ValueError("landowner checkboxes not found")
+            landowner_data["promoter_is_landowner"], landowner_data["has_other_landowners"] = states
             if landowner_data["has_other_landowners"]:
                 table = container.locator("div.table-responsive > table")
                 await table.wait_for(state="visible", timeout=5000)
-                rows = table.locator("tbody tr")
-                row_count = await rows.count()
-                if row_count == 0 or "no record found" in (await rows.first.inner_text()).lower():
+                rows = await table.evaluate(TABLE_ROWS_JS)
+                if not rows or _is_empty_sentinel(" ".join(rows[0])):
                     return landowner_data
-                names, types, shares = [], [], []
-                for i in range(row_count):
-                    row = rows.nth(i)
-                    cells = row.locator("td")
-                    if await cells.count() >= 4:
-                        name = (await cells.nth(1).text_content() or "").strip()
-                        owner_type = (await cells.nth(2).text_content() or "").strip()
-                        share_type = (await cells.nth(3).text_content() or "").strip()
-                        names.append(name)
-                        types.append(owner_type)
-                        shares.append(share_type)
-                if names:
-                    landowner_data["landowner_names"] = ", ".join(filter(None, names))
-                    landowner_data["landowner_types"] = ", ".join(filter(None, types))
-                    landowner_data["landowner_share_types"] = ", ".join(filter(None, shares))
+                full_rows = [cells for cells in rows if len(cells) > 3]
+                if full_rows:
+                    landowner_data["landowner_names"] = ", ".join(cells[1] for cells in full_rows if cells[1])
+                    landowner_data["landowner_types"] = ", ".join(cells[2] for cells in full_rows if cells[2])
+                    landowner_data["landowner_share_types"] = ", ".join(cells[3] for cells in full_rows if cells[3])
             return landowner_data
         except Exception as e:
             self.logger.warning(f"Could not extract promoter landowner details: {e}")
             return landowner_data
 
-    async def _extract_investor_flag(self, page: Page) -> Dict[str, Any]:
+    async def _extract_investor_flag(self, page: Page, timeout: int = OPTIONAL_SECTION_TIMEOUT) -> Dict[str, Any]:
         result_key = "are_there_investors_other_than_promoter"
         try:
             container = page.locator("div.col-sm-12:has(label:has-text('Are there any Investor other than the Promoter'))")
-            await container.wait_for(timeout=7000)
             answer_label = container.locator("label.form-label-preview-text > b")
-            answer = (await answer_label.inner_text()).strip()
+            answer = (await answer_label.inner_text(timeout=timeout)).strip()
             return {result_key: answer}
         except Exception as e:
             self.logger.warning(f"Could not extract investor info: {e}")
             return {result_key: None}
 
-    async def _extract_litigation_details(self, page: Page) -> Dict[str, Any]:
+    async def _extract_litigation_details(self, page: Page, timeout: int = OPTIONAL_SECTION_TIMEOUT) -> Dict[str, Any]:
         result_key = "litigation_against_project_count"
         try:
-            litigation_container = page.locator("div.white-box:has(b:has-text('Litigation Details'))")
-            await litigation_container.wait_for(timeout=7000)
-            question_container = litigation_container.locator("div:has-text('Is there any litigation against this proposed project :  ')")
-            answer_label = question_container.locator("label.form-label-preview-text  ")
-            answer_text = (await answer_label.inner_text()).strip().lower()
-            if answer_text == "no":
+            litigation_container = page.locator(_white_box_xpath("Litigation Details"))
+            # Answer and table rows come back together, scoped to the section
+            found = await litigation_container.evaluate(LITIGATION_JS, LITIGATION_QUESTION, timeout=timeout)
+            if found["answer"] is None:
+                raise ValueError("litigation answer label not found")
+            if found["answer"] == "no":
                 return {result_key: 0}
-            table = litigation_container.locator("div.table-responsive > table")
-            await table.wait_for(timeout=5000)
-            rows = table.locator("tbody > tr")
-            row_count = await rows.count()
-            if row_count == 1 and ("no data" in (await rows.first.text_content() or "").lower() or "no record" in (await rows.first.text_content() or "").lower()):
+            if found["rows"] is None:
+                # Answered yes but the table has not rendered yet
+                await litigation_container.locator("div.table-responsive > table").first.wait_for(state="attached", timeout=5000)
+                found = await litigation_container.evaluate(LITIGATION_JS, LITIGATION_QUESTION, timeout=7000)
+            rows = found["rows"]
+            if rows is None:
+                raise ValueError("litigation table not found")
+            row_count = len(rows)
+            if row_count == 1 and _is_empty_sentinel(rows[0]):
                 return {result_key: 0}
             return {result_key: row_count}
         except Exception as e:
@@ -598,229 +768,130 @@ class DataExtracter:
             return {result_key: None}
 
     async def _extract_building_details(self, page: Page) -> Dict[str, Any]:
-        def normalize(text: str) -> str:
-            return " ".join(text.split()).strip().lower()
-        header_key_map = {
-            "Identification of Building/ Wing as per Sanctioned Plan": "building_identification_plan",
-            "Identification of Wing as per Sanctioned Plan": "wing_identification_plan",
-            "Number of Sanctioned Floors (Including Basement+ Stilt+ Podium+ Service+ Habitable excluding terrace)": "sanctioned_floors",
-            "Total No. of Building Sanctioned Habitable Floor": "sanctioned_habitable_floors",
-            "Sanctioned Apartments / Unit (NR+R)": "sanctioned_apartments",
-            "CC Issued up-to (No. of Floors)": "cc_issued_floors",
-            "View": "view_document_available"
-        }
-        normalized_header_map = {normalize(k): v for k, v in header_key_map.items()}
-        building_data = {key: [] for key in header_key_map.values()}
         try:
-            container = page.locator("div.white-box:has(b:has-text('Building Details'))")
-            await container.wait_for(timeout=7000)
+            container = page.locator(_white_box_xpath("Building Details"))
             table = container.locator("table")
-            await table.wait_for(timeout=5000)
-            header_elements = await table.locator("thead th").all()
-            actual_headers = [(await h.text_content() or "").strip() for h in header_elements]
-            actual_headers = [h for h in actual_headers if h != '#']
-            rows = await table.locator("tbody tr").all()
-            for row in rows:
-                if "Total" in (await row.text_content() or ""):
-                    continue
-                cells = await row.locator("td").all()
-                row_cells = cells[1:]
-                for i, header_text in enumerate(actual_headers):
-                    if i < len(row_cells):
-                        cell = row_cells[i]
-                        dict_key = normalized_header_map.get(normalize(header_text))
-                        if not dict_key:
-                            continue
-                        if normalize(header_text) == normalize("View"):
-                            is_visible = await cell.locator("i.bi-eye-fill").count() > 0
-                            building_data[dict_key].append(str(is_visible))
-                        else:
-                            cell_text = (await cell.text_content() or "").strip()
-                            building_data[dict_key].append(cell_text)
-            final_data = {key: ", ".join(value) for key, value in building_data.items() if value}
-            return final_data
+            return self._format_building_details(await table.evaluate(BUILDING_TABLE_JS, timeout=7000))
         except Exception as e:
             self.logger.error(f"Could not extract building details: {e}")
-            return {key: None for key in header_key_map.values()}
+            return {key: None for key in BUILDING_KEYS}
+
+    def _format_building_details(self, raw_columns: Dict[str, str]) -> Dict[str, Any]:
+        building_data = {key: [] for key in BUILDING_KEYS}
+        for header_text, joined in raw_columns.items():
+            dict_key = NORMALIZED_BUILDING_HEADER_MAP.get(_normalize_header(header_text))
+            if dict_key:
+                building_data[dict_key].append(joined)
+        return {key: ", ".join(value) for key, value in building_data.items() if value}
 
     async def _extract_apartment_summary(self, page: Page) -> Dict[str, Any]:
-        all_keys = {
-            "summary_identification_building_wing": None, "summary_identification_wing_plan": None,
-            "summary_floor_type": None, "summary_total_no_of_residential_apartments": None,
-            "summary_total_no_of_non_residential_apartments": None, "summary_total_no_of_apartments_nr_r": None,
-            "summary_total_no_of_sold_units": None, "summary_total_no_of_unsold_units": None,
-            "summary_total_no_of_booked": None, "summary_total_no_of_rehab_units": None,
-            "summary_total_no_of_mortgage": None, "summary_total_no_of_reservation": None,
-            "summary_total_no_of_land_owner_investor_share_sale": None,
-            "summary_total_no_of_land_owner_investor_share_not_for_sale": None, "total_no_of_apartments": None,
-        }
         try:
-            container = page.locator("div.white-box:has(b:has-text('Summary of Apartments/Units'))")
-            await container.wait_for(timeout=7000)
+            container = page.locator(_white_box_xpath("Summary of Apartments/Units"))
             table = container.locator("table")
-            await table.wait_for(timeout=5000)
-            header_elements = await table.locator("thead th").all()
-            header_count = len(header_elements)
-            if header_count > 10:
-                header_map = {
-                    "Identification of Building/ Wing as per Sanctioned Plan": "summary_identification_building_wing",
-                    "Identification of Wing as per Sanctioned Plan": "summary_identification_wing_plan",
-                    "Floor Type": "summary_floor_type",
-                    "Total No. Of Residential Apartments/ Units": "summary_total_no_of_residential_apartments",
-                    "Total No. Of Non-Residential Apartments/ Units": "summary_total_no_of_non_residential_apartments",
-                    "Total Apartments / Unit (NR+R)": "summary_total_no_of_apartments_nr_r",
-                    "Total No. of Sold Units": "summary_total_no_of_sold_units",
-                    "Total No. of Unsold Units": "summary_total_no_of_unsold_units",
-                    "Total No. of Booked": "summary_total_no_of_booked",
-                    "Total No. of Rehab Units": "summary_total_no_of_rehab_units",
-                    "Total No. of Mortgage": "summary_total_no_of_mortgage",
-                    "Total No. of Reservation": "summary_total_no_of_reservation",
-                    "Total No. of Land Owner/ Investor Share (For Sale)": "summary_total_no_of_land_owner_investor_share_sale",
-                    "Total No. of Land Owner/ Investor Share (Not For Sale)": "summary_total_no_of_land_owner_investor_share_not_for_sale",
-                }
-                temp_data = {key: [] for key in header_map.values()}
-                actual_headers = [(await h.text_content() or "").strip() for h in header_elements if (await h.text_content() or "").strip() != '#']
-                rows = await table.locator("tbody tr").all()
-                for row in rows:
-                    if "Total" in (await row.text_content() or ""): continue
-                    cells = await row.locator("td").all()
-                    row_cells = cells[1:]
-                    for j, header_text in enumerate(actual_headers):
-                        if j < len(row_cells):
-                            cell = row_cells[j]
-                            dict_key = header_map.get(header_text)
-                            if dict_key:
-                                temp_data[dict_key].append((await cell.text_content() or "").strip())
-                for key, values in temp_data.items():
-                    all_keys[key] = ", ".join(values)
-            elif header_count == 5:
-                total_apartments = 0
-                rows = await table.locator("tbody tr").all()
-                for row in rows:
-                    cells = await row.locator("td").all()
-                    if len(cells) == 5:
-                        try:
-                            num_text = (await cells[4].text_content() or "0").strip()
-                            if num_text: total_apartments += int(num_text)
-                        except (ValueError, IndexError): continue
-                all_keys["total_no_of_apartments"] = str(total_apartments)
-            return all_keys
+            return self._format_apartment_summary(await table.evaluate(APARTMENT_SUMMARY_JS, timeout=7000))
         except Exception as e:
             self.logger.error(f"Could not extract apartment summary: {e}")
-            return all_keys
-
-    async def _extract_parking_details(self, page: Page) -> Dict[str, Any]:
+            return dict.fromkeys(APARTMENT_SUMMARY_KEYS)
+
+    def _format_apartment_summary(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+        all_keys = dict.fromkeys(APARTMENT_SUMMARY_KEYS)
+        header_count = summary["headerCount"]
+        if header_count > 10:
+            temp_data = {key: [] for key in APARTMENT_SUMMARY_HEADER_MAP.values()}
+            for header_text, joined in summary["columns"].items():
+                dict_key = APARTMENT_SUMMARY_HEADER_MAP.get(header_text)
+                if dict_key:
+                    temp_data[dict_key].append(joined)
+            for key, values in temp_data.items():
+                all_keys[key] = ", ".join(values)
+        elif header_count == 5:
+            all_keys["total_no_of_apartments"] = str(summary["unitTotal"])
+        return all_keys
+
+    async def _extract_parking_details(self, page: Page, timeout: int = OPTIONAL_SECTION_TIMEOUT) -> Dict[str, Any]:
         results = { "open_space_parking_total": None, "closed_space_parking_total": None }
         try:
-            button = page.locator("button:has-text('Parking Details')")
-            await button.wait_for(timeout=7000)
             parking_section = page.locator("div#parkingDetails")
-            if not "show" in (await parking_section.get_attribute("class") or ""):
-                await button.click()
-                # FIX: Replaced flaky expect with a more reliable wait for the table inside.
-                await parking_section.locator("table").first.wait_for(state="visible", timeout=5000)
-            
+            # Only click a collapsed accordion; clicking an open one would close it
+            section_class = await parking_section.get_attribute("class", timeout=timeout) or ""
+            if "show" not in section_class.split():
+                button = page.locator("button:has-text('Parking Details')")
+                await button.click(timeout=7000)
+            # The accordion body is already in the DOM; a project without parking has no table in it
+            first_table = parking_section.locator("table").first
+            if await first_table.count() == 0:
+                return results
+            # FIX: Replaced flaky expect with a more reliable wait for the table inside.
+            await first_table.wait_for(state="visible", timeout=5000)
+
             tables = parking_section.locator("div.table-responsive > table")
-            table_count = await tables.count()
-            if table_count == 0:
+            sums = await tables.evaluate_all(PARKING_SUMS_JS)
+            if not sums:
                 return results
-            open_counts, closed_counts = [], []
-            for i in range(table_count):
-                table = tables.nth(i)
-                rows = await table.locator("tbody tr").all()
-                open_sum_for_table, closed_sum_for_table = 0, 0
-                for row in rows:
-                    cells = await row.locator("td").all()
-                    if len(cells) < 8: continue
-                    try:
-                        parking_type = (await cells[1].inner_text()).strip().lower()
-                        count_text = (await cells[6].inner_text()).strip()
-                        count = int(count_text) if count_text.isdigit() else 0
-                        if "open" in parking_type: open_sum_for_table += count
-                        elif "closed" in parking_type or "covered" in parking_type: closed_sum_for_table += count
-                    except (ValueError, IndexError):
-                        continue
-                open_counts.append(str(open_sum_for_table))
-                closed_counts.append(str(closed_sum_for_table))
-            results["open_space_parking_total"] = ", ".join(open_counts)
-            results["closed_space_parking_total"] = ", ".join(closed_counts)
+            results["open_space_parking_total"] = ", ".join(str(t["open"]) for t in sums)
+            results["closed_space_parking_total"] = ", ".join(str(t["closed"]) for t in sums)
             return results
         except Exception as e:
             self.logger.warning(f"Could not extract parking details: {e}")
             return results
 
     async def _extract_bank_details(self, page: Page) -> Dict[str, Optional[str]]:
-        result = { "bank_name": None, "ifsc_code": None, "bank_address": None }
         try:
-            container = page.locator("project-bank-details-preview fieldset").nth(0)
-            await container.wait_for(timeout=7000)
-            fields_to_extract = { "Bank Name": "bank_name", "IFSC Code": "ifsc_code", "Bank Address": "bank_address" }
-            for label_text, dict_key in fields_to_extract.items():
-                try:
-                    label_locator = container.locator(f"label.form-label:has-text('{label_text}')")
-                    value_locator = label_locator.locator("xpath=following-sibling::div[1]")
-                    value = (await value_locator.inner_text()).strip()
-                    result[dict_key] = value
-                except Exception as inner_e:
-                    self.logger.warning(f"Could not find bank field '{label_text}': {inner_e}")
-                    continue
-            return result
+            container = page.locator("project-bank-details-preview fieldset").first
+            return self._format_bank_details(await container.evaluate(LABEL_VALUES_JS, timeout=7000))
         except Exception as e:
             self.logger.error(f"Failed to extract bank details section: {e}")
-            return result
+            return dict.fromkeys(BANK_FIELDS.values())
+
+    def _format_bank_details(self, label_values: List[List[Optional[str]]]) -> Dict[str, Optional[str]]:
+        result = dict.fromkeys(BANK_FIELDS.values())
+        for label_text, dict_key in BANK_FIELDS.items():
+            value = next((v for label, v in label_values if label_text.lower() in label.lower() and v is not None), None)
+            if value is None:
+                self.logger.warning(f"Could not find bank field '{label_text}'")
+                continue
+            result[dict_key] = value
+        return result
 
     async def _extract_complaint_details(self, page: Page) -> Dict[str, Any]:
         result = { "complaint_count": 0, "complaint_numbers": None }
         try:
-            container = page.locator("div.white-box:has(b:has-text('Complaint Details'))")
-            await container.wait_for(timeout=7000)
+            container = page.locator(_white_box_xpath("Complaint Details"))
             table = container.locator("div.table-responsive > table")
-            await table.wait_for(timeout=5000)
-            rows = table.locator("tbody tr")
-            row_count = await rows.count()
-            if row_count == 0 or (row_count == 1 and ("no data" in (await rows.first.text_content() or "").lower() or "no record" in (await rows.first.text_content() or "").lower())):
-                return result
-            complaint_numbers = []
-            for i in range(row_count):
-                row = rows.nth(i)
-                cells = await row.locator("td").all()
-                if len(cells) > 1:
-                    complaint_no = (await cells[1].text_content() or "").strip()
-                    if complaint_no:
-                        complaint_numbers.append(complaint_no)
-            if complaint_numbers:
-                result["complaint_count"] = len(complaint_numbers)
-                result["complaint_numbers"] = ", ".join(complaint_numbers)
-            return result
+            return self._format_complaint_details(await table.evaluate(TABLE_ROWS_JS, timeout=7000))
         except Exception as e:
             self.logger.warning(f"Could not extract complaint details: {e}")
             return result
 
-    async def _extract_real_estate_agents(self, page: Page) -> Dict[str, Any]:
+    def _format_complaint_details(self, rows: List[List[str]]) -> Dict[str, Any]:
+        result = { "complaint_count": 0, "complaint_numbers": None }
+        row_count = len(rows)
+        if row_count == 0 or (row_count == 1 and _is_empty_sentinel(" ".join(rows[0]))):
+            return result
+        complaint_numbers = [cells[1] for cells in rows if len(cells) > 1 and cells[1]]
+        if complaint_numbers:
+            result["complaint_count"] = len(complaint_numbers)
+            result["complaint_numbers"] = ", ".join(complaint_numbers)
+        return result
+
+    async def _extract_real_estate_agents(self, page: Page, timeout: int = OPTIONAL_SECTION_TIMEOUT) -> Dict[str, Any]:
         result = { "real_estate_agent_names": None, "maharera_certificate_nos": None }
         try:
             button = page.locator("button:has-text('Registered Agent(s)')")
-            await button.wait_for(timeout=7000)
-            target_id = await button.get_attribute("data-bs-target")
+            target_id = await button.get_attribute("data-bs-target", timeout=timeout)
             if not target_id:
                 raise Exception("Could not find 'data-bs-target' on the agent accordion button.")
             table = page.locator(f"{target_id} div.table-responsive > table")
             if not await table.is_visible():
                 await button.click()
                 await table.wait_for(state="visible", timeout=5000)
-            rows = table.locator("tbody tr")
-            row_count = await rows.count()
-            if row_count == 0 or (row_count == 1 and ("no data" in (await rows.first.text_content() or "").lower() or "no record" in (await rows.first.text_content() or "").lower())):
+            rows = await table.evaluate(TABLE_ROWS_JS)
+            row_count = len(rows)
+            if row_count == 0 or (row_count == 1 and _is_empty_sentinel(" ".join(rows[0]))):
                 return result
-            agent_names, cert_numbers = [], []
-            for i in range(row_count):
-                row = rows.nth(i)
-                cells = await row.locator("td").all()
-                if len(cells) > 2:
-                    name = (await cells[1].text_content() or "").strip()
-                    cert_no = (await cells[2].text_content() or "").strip()
-                    if name: agent_names.append(name)
-                    if cert_no: cert_numbers.append(cert_no)
+            full_rows = [cells for cells in rows if len(cells) > 2]
+            agent_names = [cells[1] for cells in full_rows if cells[1]]
+            cert_numbers = [cells[2] for cells in full_rows if cells[2]]
             if agent_names: result["real_estate_agent_names"] = ", ".join(agent_names)
             if cert_numbers: result["maharera_certificate_nos"] = ", ".join(cert_numbers)
             return result
@@ -1,9 +1,12 @@
 import asyncio
+import atexit
 import csv
 import os
 import pandas as pd
+from contextlib import asynccontextmanager
+from openpyxl import Workbook, load_workbook
 from playwright.async_api import async_playwright
-from typing import Callable, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from modules.data_extracter import DataExtracter
 from modules.captcha_solver import CaptchaSolver
@@ -20,10 +23,35 @@ CAPTCHA_INPUT = "input[name='captcha']"
 CAPTCHA_SUBMIT = "button.next"
 CAPTCHA_REFRESH = "#captchaRefresh"
 
+# Shown once the CAPTCHA is accepted and the project page has rendered
+PROJECT_READY_SELECTOR = "div.white-box h5.card-title:has-text('Promoter Details')"
+
+# Sections that render after the Promoter Details card: litigation, parking
+# and agents. Extraction waits for one of them before harvesting the page.
+LATE_SECTIONS_SELECTOR = (
+    "div.white-box:has(b:has-text('Litigation Details')), "
+    "div#parkingDetails, "
+    "button:has-text('Registered Agent(s)')"
+)
+LATE_SECTIONS_TIMEOUT = 10000
+
 # INVALID CAPTCHA MODAL
 INVALID_CAPTCHA_TEXT = "text=Invalid Captcha"
 INVALID_CAPTCHA_OK_BTN = "button.btn-primary-messagebox.next"
 
+# Resource types aborted on the search page; it is only driven by selectors
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}
+# Project tabs keep their stylesheets: the extractors rely on visibility
+# checks for tabs and accordions, which need the page's CSS
+PROJECT_BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES - {"stylesheet"}
+
+# Concurrent contexts (each with its own search page) sharing one browser
+DEFAULT_WORKERS = 1
+
+# Contexts are closed and reopened after this many records so Playwright can
+# release per-page objects it only frees with the context
+CONTEXT_RECYCLE_EVERY = 50
+
 # Column order for full page extraction
 CSV_COLUMNS = [
     "rera_no", "registration_number", "date_of_registration", "project_name",
@@ -68,38 +96,148 @@ CSV_COLUMNS = [
 
 
 # --------------------------------------------------
-# FILE APPEND HELPER (CSV or XLSX)
+# BATCHED FILE WRITER (CSV or XLSX)
 # --------------------------------------------------
-def append_to_file(path: str, row: dict):
-    """Append a single record to CSV or XLSX with fixed column order."""
-    dir_path = os.path.dirname(path)
-    if dir_path:
-        os.makedirs(dir_path, exist_ok=True)
-
-    ordered_row = {col: row.get(col, "") for col in CSV_COLUMNS}
-
-    if path.endswith('.xlsx'):
-        # XLSX handling
-        if os.path.isfile(path):
-            # Read existing data and append
-            df_existing = pd.read_excel(path)
-            df_new = pd.DataFrame([ordered_row])
-            df_combined = pd.concat([df_existing, df_new], ignore_index=True)
-            df_combined = df_combined.reindex(columns=CSV_COLUMNS)
-            df_combined.to_excel(path, index=False)
-        else:
-            # Create new file
-            df = pd.DataFrame([ordered_row])
-            df = df.reindex(columns=CSV_COLUMNS)
-            df.to_excel(path, index=False)
-    else:
-        # CSV handling (default)
-        file_exists = os.path.isfile(path)
-        with open(path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
+class BatchWriter:
+    """Buffer records and append them to CSV or XLSX in batches, with fixed column order.
+
+    Rows are buffered as plain value lists in CSV_COLUMNS order rather than
+    dicts. CSV keeps one open handle and writer for the whole run; XLSX appends
+    each batch with openpyxl instead of re-reading the sheet through pandas.
+    The buffer stays small because a terminated run loses whatever is unflushed
+    (those RERA numbers are simply picked up again on the next run).
+    """
+
+    def __init__(self, path: str, flush_size: int = 25):
+        self.path = path
+        self.flush_size = flush_size
+        self.buffer: List[list] = []
+        self._csv_file = None
+        self._csv_writer = None
+        self._workbook = None
+        # Keeps batches in order while their writes run on worker threads
+        self._write_lock = asyncio.Lock()
+
+        dir_path = os.path.dirname(path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+
+        if not path.endswith('.xlsx'):
+            file_exists = os.path.isfile(path)
+            self._csv_file = open(path, "a", newline="", encoding="utf-8", buffering=1 << 20)
+            self._csv_writer = csv.writer(self._csv_file)
             if not file_exists:
-                writer.writeheader()
-            writer.writerow(ordered_row)
+                self._csv_writer.writerow(CSV_COLUMNS)
+
+    async def add(self, row: dict):
+        self.buffer.append([row.get(col, "") for col in CSV_COLUMNS])
+        if len(self.buffer) >= self.flush_size:
+            await self.flush()
+
+    async def flush(self):
+        """Write the buffered batch on a worker thread so Playwright traffic keeps flowing."""
+        if not self.buffer:
+            return
+        # Swap the buffer out first; rows added while this batch is written start the next one
+        rows, self.buffer = self.buffer, []
+        async with self._write_lock:
+            await asyncio.to_thread(self._write, rows)
+
+    def close(self):
+        """Synchronously write whatever is left and release the CSV handle."""
+        if self.buffer:
+            rows, self.buffer = self.buffer, []
+            self._write(rows)
+        if self._csv_file is not None and not self._csv_file.closed:
+            self._csv_file.close()
+
+    def _write(self, rows: List[list]):
+        if self._csv_writer is not None:
+            self._csv_writer.writerows(rows)
+            self._csv_file.flush()
+        else:
+            self._append_xlsx(rows)
+
+    def _append_xlsx(self, rows: List[list]):
+        # The workbook is parsed (or created) once and kept open; later batches
+        # only append rows and save
+        if self._workbook is None:
+            if os.path.isfile(self.path):
+                self._workbook = load_workbook(self.path)
+            else:
+                self._workbook = Workbook()
+                self._workbook.active.append(CSV_COLUMNS)
+        ws = self._workbook.active
+        for row in rows:
+            # Empty strings become blank cells, as pandas wrote them before
+            ws.append([None if value == "" else value for value in row])
+        self._workbook.save(self.path)
+
+
+# --------------------------------------------------
+# BROWSER CONTEXT HELPER
+# --------------------------------------------------
+async def open_context(browser):
+    """New context with static resources blocked, plus the reusable search page."""
+    # Service workers are blocked so every request goes through the route below
+    context = await browser.new_context(service_workers="block")
+    # Context-level route so the project tabs opened via "View Details"
+    # are covered too
+    await context.route("**/*", lambda route: route.abort()
+                        if route.request.resource_type in PROJECT_BLOCKED_RESOURCE_TYPES
+                        else route.continue_())
+    page = await context.new_page()
+    # Page routes take precedence, so only the search page also drops CSS
+    await page.route("**/*", lambda route: route.abort()
+                     if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+                     else route.continue_())
+    return context, page
+
+
+class ContextPool:
+    """Warm contexts (each with its search page) checked out one record at a time.
+
+    A context is closed and replaced once it has served max_uses records, which
+    bounds what Playwright keeps alive per context over a long run.
+    """
+
+    def __init__(self, browser, size: int, max_uses: int = CONTEXT_RECYCLE_EVERY):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[Any, int] = {}
+        # Serialise creation so concurrent recycles cannot orphan a context
+        self._spawn_lock = asyncio.Lock()
+
+    async def _spawn(self):
+        async with self._spawn_lock:
+            context, page = await open_context(self.browser)
+            self._uses[context] = 0
+        self._idle.put_nowait((context, page))
+
+    async def start(self):
+        for _ in range(self.size):
+            await self._spawn()
+
+    @asynccontextmanager
+    async def acquire(self):
+        context, page = await self._idle.get()
+        try:
+            yield context, page
+        finally:
+            self._uses[context] += 1
+            if self._uses[context] >= self.max_uses:
+                del self._uses[context]
+                await context.close()
+                await self._spawn()
+            else:
+                self._idle.put_nowait((context, page))
+
+    async def close(self):
+        for context in list(self._uses):
+            await context.close()
+        self._uses.clear()
 
 
 # --------------------------------------------------
@@ -116,6 +254,44 @@ async def handle_invalid_captcha_modal(page) -> bool:
         return False
 
 
+# --------------------------------------------------
+# READ INPUT RERA COLUMN
+# --------------------------------------------------
+def read_input_column(input_path: str, column: str) -> Tuple[List[str], Optional[list]]:
+    """Header and the values of one column of the input CSV/XLSX, streamed row by row.
+
+    Values is None when the column is missing; blank cells come back as None.
+    """
+    if input_path.endswith('.csv'):
+        with open(input_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if column not in header:
+                return header, None
+            col = header.index(column)
+            # csv.reader yields [] for blank lines; skip them as pandas did
+            return header, [(row[col] or None) if col < len(row) else None for row in reader if row]
+
+    if input_path.endswith('.xls'):
+        # Legacy .xls is not readable by openpyxl
+        df = pd.read_excel(input_path, sheet_name=0)
+        header = [str(h) for h in df.columns]
+        if column not in header:
+            return header, None
+        return header, [None if pd.isna(v) else v for v in df.iloc[:, header.index(column)]]
+
+    wb = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        header = [str(h) if h is not None else "" for h in next(ws.iter_rows(max_row=1, values_only=True), ())]
+        if column not in header:
+            return header, None
+        col = header.index(column) + 1
+        return header, [value for (value,) in ws.iter_rows(min_row=2, min_col=col, max_col=col, values_only=True)]
+    finally:
+        wb.close()
+
+
 # --------------------------------------------------
 # GET ALREADY PROCESSED RERA NUMBERS
 # --------------------------------------------------
@@ -123,13 +299,29 @@ def get_processed_rera_numbers(output_path: str) -> Set[str]:
     """Read already processed RERA numbers from the output CSV or XLSX."""
     processed = set()
     if os.path.exists(output_path):
+        # Streams only the rera_no column instead of loading a DataFrame
         try:
             if output_path.endswith('.xlsx'):
-                df = pd.read_excel(output_path, usecols=['rera_no'])
+                wb = load_workbook(output_path, read_only=True, data_only=True)
+                try:
+                    ws = wb.active
+                    header = next(ws.iter_rows(max_row=1, values_only=True), ())
+                    col = list(header).index('rera_no') + 1
+                    for (value,) in ws.iter_rows(min_row=2, min_col=col, max_col=col, values_only=True):
+                        if value is not None and str(value).strip():
+                            processed.add(str(value).strip())
+                finally:
+                    wb.close()
             else:
-                df = pd.read_csv(output_path, usecols=['rera_no'], on_bad_lines='skip')
-            processed = set(df['rera_no'].dropna().astype(str).str.strip().tolist())
-        except (ValueError, KeyError, FileNotFoundError):
+                with open(output_path, newline="", encoding="utf-8") as f:
+                    reader = csv.DictReader(f)
+                    if 'rera_no' not in (reader.fieldnames or []):
+                        raise KeyError('rera_no')
+                    for row in reader:
+                        value = (row.get('rera_no') or "").strip()
+                        if value:
+                            processed.add(value)
+        except (ValueError, KeyError, FileNotFoundError, csv.Error):
             pass
     return processed
 
@@ -145,7 +337,8 @@ async def run_scraper(
     max_captcha_attempts: int = 6,
     rera_column: str = DEFAULT_RERA_COLUMN,
     log_callback: Optional[Callable[[str], None]] = None,
-    stop_flag: Optional[Callable[[], bool]] = None
+    stop_flag: Optional[Callable[[], bool]] = None,
+    workers: int = DEFAULT_WORKERS
 ) -> dict:
     """
     Main scraper function that can be called from Streamlit or CLI.
@@ -159,6 +352,7 @@ async def run_scraper(
         rera_column: Column name containing RERA numbers
         log_callback: Optional function to send log messages to UI
         stop_flag: Optional function that returns True if scraping should stop
+        workers: Number of concurrent browser contexts sharing one browser
 
     Returns:
         dict with 'success_count', 'error_count', 'total'
@@ -178,32 +372,30 @@ async def run_scraper(
     # 1. LOAD INPUT FILE
     # --------------------------------------------------
     try:
-        if input_path.endswith('.csv'):
-            df = pd.read_csv(input_path)
-        else:
-            df = pd.read_excel(input_path)
+        columns, values = read_input_column(input_path, rera_column)
     except Exception as e:
         log(f"ERROR: Could not read input file: {e}")
         return stats
 
-    if rera_column not in df.columns:
+    if values is None:
         log(f"ERROR: Missing column '{rera_column}' in input file")
-        log(f"Available columns: {list(df.columns)}")
+        log(f"Available columns: {columns}")
         return stats
 
     start_index = max(start_row - 2, 0)
 
-    rera_numbers = (
-        df.loc[start_index:, rera_column]
-        .dropna()
-        .astype(str)
-        .str.strip()
-        .tolist()
-    )
-
-    # Filter out already processed
+    # One pass over the column: drop blanks, strip, and skip already processed
+    # or repeated numbers
     processed = get_processed_rera_numbers(output_path)
-    rera_numbers = [r for r in rera_numbers if r not in processed]
+    pending: Set[str] = set()
+    for value in values[start_index:]:
+        if value is None:
+            continue
+        rera_no = str(value).strip()
+        if rera_no not in processed:
+            pending.add(rera_no)
+    # Sorted so neighbouring registrations (same district prefix) are searched together
+    rera_numbers = sorted(pending)
 
     stats["total"] = len(rera_numbers)
 
@@ -213,138 +405,173 @@ async def run_scraper(
         log("No new RERA numbers to process.")
         return stats
 
+    writer = BatchWriter(output_path)
+    # Flushes the tail of the buffer on normal interpreter exit as well
+    atexit.register(writer.close)
+
     # --------------------------------------------------
     # 2. PLAYWRIGHT SETUP
     # --------------------------------------------------
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=headless,
-            slow_mo=100
-        )
-
-        context = await browser.new_context()
-        captcha_solver = CaptchaSolver()
-        data_extracter = DataExtracter()
-
-        # --------------------------------------------------
-        # 3. PROCESS EACH RERA NUMBER
-        # --------------------------------------------------
-        for idx, rera_no in enumerate(rera_numbers, start=1):
-            if should_stop():
-                log("Scraping stopped by user.")
-                break
-
-            log(f"\n[{idx}/{stats['total']}] Processing RERA No: {rera_no}")
-            page = await context.new_page()
+    queue: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(rera_numbers, start=1):
+        queue.put_nowait(item)
+    stop_logged = False
 
-            try:
-                # SEARCH PAGE
-                await page.goto(DEFAULT_SEARCH_URL, wait_until="domcontentloaded")
+    try:
+        async with async_playwright() as p:
+            # No slow_mo: every step below already waits on an explicit selector
+            browser = await p.chromium.launch(headless=headless)
+            # Shared by all workers; neither keeps per-record state
+            captcha_solver = CaptchaSolver()
+            data_extracter = DataExtracter()
+
+            # --------------------------------------------------
+            # 3. PROCESS ONE RERA NUMBER
+            # --------------------------------------------------
+            async def process_record(context, page, idx: int, rera_no: str):
+                log(f"\n[{idx}/{stats['total']}] Processing RERA No: {rera_no}")
+                project_page = None
 
-                await page.fill(
-                    "input[placeholder='Project Name/ MahaRERA Registration Number']",
-                    rera_no
-                )
+                try:
+                    # SEARCH PAGE
+                    await page.goto(DEFAULT_SEARCH_URL, wait_until="domcontentloaded")
 
-                await page.get_by_role("button", name="Search").first.click()
-                await page.wait_for_selector("text=View Details", timeout=30000)
+                    await page.fill(
+                        "input[placeholder='Project Name/ MahaRERA Registration Number']",
+                        rera_no
+                    )
 
-                # OPEN VIEW DETAILS (NEW TAB)
-                async with context.expect_page() as new_tab:
-                    await page.get_by_role("link", name="View Details").first.click()
+                    await page.get_by_role("button", name="Search").first.click()
+                    await page.wait_for_selector("text=View Details", timeout=30000)
 
-                    # YES CONFIRMATION POPUP (IF PRESENT) - must click before new tab opens
-                    try:
-                        await page.wait_for_selector(
-                            "div.dialog",
-                            timeout=3000
-                        )
-                        # Click the Yes button (ID starts with "confirm-ok-")
-                        await page.locator("button[id^='confirm-ok-']").click()
-                        log("  Confirmation popup accepted")
-                    except:
-                        pass  # No confirmation popup
+                    # OPEN VIEW DETAILS (NEW TAB)
+                    async with context.expect_page() as new_tab:
+                        await page.get_by_role("link", name="View Details").first.click()
 
-                project_page = await new_tab.value
-                await project_page.bring_to_front()
+                        # YES CONFIRMATION POPUP (IF PRESENT) - must click before new tab opens
+                        try:
+                            await page.wait_for_selector(
+                                "div.dialog",
+                                timeout=3000
+                            )
+                            # Click the Yes button (ID starts with "confirm-ok-")
+                            await page.locator("button[id^='confirm-ok-']").click()
+                            log("  Confirmation popup accepted")
+                        except:
+                            pass  # No confirmation popup
 
-                # CAPTCHA HANDLING
-                try:
-                    await project_page.wait_for_selector(CAPTCHA_CANVAS, timeout=5000)
-                    log("CAPTCHA detected - starting auto solve")
+                    project_page = await new_tab.value
+                    await project_page.bring_to_front()
+
+                    # CAPTCHA HANDLING
+                    try:
+                        await project_page.wait_for_selector(CAPTCHA_CANVAS, timeout=5000)
+                        log("CAPTCHA detected - starting auto solve")
 
-                    captcha_solved = False
+                        captcha_solved = False
 
-                    for attempt in range(1, max_captcha_attempts + 1):
-                        log(f"  CAPTCHA attempt {attempt}/{max_captcha_attempts}")
+                        for attempt in range(1, max_captcha_attempts + 1):
+                            log(f"  CAPTCHA attempt {attempt}/{max_captcha_attempts}")
 
-                        await captcha_solver.solve_and_fill(
-                            page=project_page,
-                            captcha_selector=CAPTCHA_CANVAS,
-                            input_selector=CAPTCHA_INPUT,
-                            submit_selector=CAPTCHA_SUBMIT,
-                            reg_no=rera_no
-                        )
+                            await captcha_solver.solve_and_fill(
+                                page=project_page,
+                                captcha_selector=CAPTCHA_CANVAS,
+                                input_selector=CAPTCHA_INPUT,
+                                submit_selector=CAPTCHA_SUBMIT,
+                                reg_no=rera_no
+                            )
 
-                        # SUCCESS CHECK
-                        try:
-                            await project_page.wait_for_selector(
-                                "div.white-box h5.card-title:has-text('Promoter Details')",
-                                timeout=2500
+                            # SUCCESS CHECK: return on whichever of the project card or
+                            # the Invalid Captcha modal appears first, not a fixed 2.5s
+                            project_ready = project_page.locator(PROJECT_READY_SELECTOR)
+                            try:
+                                await project_ready.or_(
+                                    project_page.locator(INVALID_CAPTCHA_TEXT)
+                                ).first.wait_for(timeout=2500)
+                            except:
+                                pass
+                            if await project_ready.count() > 0:
+                                captcha_solved = True
+                                log("  CAPTCHA solved successfully")
+                                break
+
+                            await handle_invalid_captcha_modal(project_page)
+
+                            await project_page.evaluate(
+                                "document.querySelector('#captchaRefresh')?.click()"
                             )
-                            captcha_solved = True
-                            log("  CAPTCHA solved successfully")
-                            break
-                        except:
-                            pass
+                            await project_page.wait_for_timeout(200)
 
-                        await handle_invalid_captcha_modal(project_page)
+                        if not captcha_solved:
+                            log("  CAPTCHA failed after all attempts - skipping")
+                            stats["error_count"] += 1
+                            return
 
-                        await project_page.evaluate(
-                            "document.querySelector('#captchaRefresh')?.click()"
+                    except:
+                        log("  No CAPTCHA on this record")
+
+                    # WAIT FOR PROJECT PAGE
+                    await project_page.wait_for_url("**/public/project/view/**", timeout=30000)
+                    await project_page.wait_for_selector(PROJECT_READY_SELECTOR, timeout=60000)
+                    # No networkidle barrier: the site's background requests keep it
+                    # from settling. Wait for the late-rendering sections instead, as
+                    # the page is harvested in one pass as soon as extraction starts.
+                    try:
+                        await project_page.wait_for_selector(
+                            LATE_SECTIONS_SELECTOR, state="attached", timeout=LATE_SECTIONS_TIMEOUT
                         )
-                        await project_page.wait_for_timeout(200)
-
-                    if not captcha_solved:
-                        log("  CAPTCHA failed after all attempts - skipping")
+                    except Exception:
+                        log("  Late sections not rendered - extracting what is on the page")
+
+                    # EXTRACT FULL PROJECT DETAILS
+                    data = await data_extracter.extract_project_details(project_page, rera_no)
+
+                    if data:
+                        data["rera_no"] = rera_no
+                        await writer.add(data)
+                        stats["success_count"] += 1
+                        log(f"  SUCCESS: Data extracted for {rera_no}")
+                    else:
                         stats["error_count"] += 1
-                        await project_page.close()
-                        continue
-
-                except:
-                    log("  No CAPTCHA on this record")
-
-                # WAIT FOR PROJECT PAGE
-                await project_page.wait_for_url("**/public/project/view/**", timeout=30000)
-                await project_page.wait_for_selector(
-                    "div.white-box h5.card-title:has-text('Promoter Details')",
-                    timeout=60000
-                )
-                await project_page.wait_for_load_state('networkidle', timeout=30000)
-                await project_page.wait_for_timeout(2500)
-
-                # EXTRACT FULL PROJECT DETAILS
-                data = await data_extracter.extract_project_details(project_page, rera_no)
-
-                if data:
-                    data["rera_no"] = rera_no
-                    append_to_file(output_path, data)
-                    stats["success_count"] += 1
-                    log(f"  SUCCESS: Data extracted for {rera_no}")
-                else:
-                    stats["error_count"] += 1
-                    log(f"  WARNING: No data extracted for {rera_no}")
+                        log(f"  WARNING: No data extracted for {rera_no}")
 
-                await project_page.close()
+                except Exception as e:
+                    stats["error_count"] += 1
+                    log(f"  ERROR for {rera_no}: {e}")
 
-            except Exception as e:
-                stats["error_count"] += 1
-                log(f"  ERROR for {rera_no}: {e}")
+                finally:
+                    if project_page is not None and not project_page.is_closed():
+                        await project_page.close()
 
+            # --------------------------------------------------
+            # 4. WORKERS DRAINING THE QUEUE
+            # --------------------------------------------------
+            async def worker():
+                nonlocal stop_logged
+                while not queue.empty():
+                    if should_stop():
+                        if not stop_logged:
+                            stop_logged = True
+                            log("Scraping stopped by user.")
+                        break
+
+                    idx, rera_no = queue.get_nowait()
+                    # The search page is reused; only the per-project
+                    # "View Details" tab is opened and closed each time
+                    async with pool.acquire() as (context, page):
+                        await process_record(context, page, idx, rera_no)
+
+            worker_count = max(1, min(workers, len(rera_numbers)))
+            pool = ContextPool(browser, size=worker_count)
+            await pool.start()
+            try:
+                await asyncio.gather(*(worker() for _ in range(worker_count)))
             finally:
-                await page.close()
-
-        await browser.close()
+                await pool.close()
+            await browser.close()
+    finally:
+        writer.close()
+        atexit.unregister(writer.close)
 
     log(f"\n{'='*50}")
     log(f"SCRAPING COMPLETE")
@@ -366,7 +593,8 @@ async def main():
         output_path="data/output/maharera_full_data.csv",
         start_row=2,
         headless=False,
-        max_captcha_attempts=6
+        max_captcha_attempts=6,
+        workers=3
     )
 
 
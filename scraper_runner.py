@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import atexit
+import signal
+
+from scraper import DEFAULT_RERA_COLUMN, run_scraper
+
+# Log lines are buffered and written out on this interval rather than per line
+LOG_FLUSH_INTERVAL = 0.2
+LOG_BUFFER_SIZE = 1 << 16
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the MahaRERA scraper with logs appended to a file.")
+    parser.add_argument("--input", required=True, help="Excel/CSV file with RERA numbers")
+    parser.add_argument("--output", required=True, help="CSV/XLSX file to write records to")
+    parser.add_argument("--log-file", required=True, help="File to append progress logs to")
+    parser.add_argument("--start-row", type=int, default=2)
+    parser.add_argument("--max-captcha-attempts", type=int, default=6)
+    parser.add_argument("--rera-column", default=DEFAULT_RERA_COLUMN)
+    parser.add_argument("--headless", action="store_true")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+
+    log_fh = open(args.log_file, "a", buffering=LOG_BUFFER_SIZE)
+    atexit.register(log_fh.flush)
+
+    def log_to_file(msg):
+        log_fh.write(msg)
+        log_fh.write("\n")
+
+    async def periodic_flush():
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL)
+            log_fh.flush()
+
+    # Stop in the UI sends SIGTERM, which skips finally blocks and atexit.
+    # Turn it into a cancellation so run_scraper writes out its buffered
+    # records and the log below is flushed before the process exits.
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, task.cancel)
+    except NotImplementedError:
+        signal.signal(signal.SIGTERM, lambda *_: loop.call_soon_threadsafe(task.cancel))
+
+    flusher = asyncio.create_task(periodic_flush())
+    try:
+        await run_scraper(
+            input_path=args.input,
+            output_path=args.output,
+            start_row=args.start_row,
+            headless=args.headless,
+            max_captcha_attempts=args.max_captcha_attempts,
+            rera_column=args.rera_column,
+            log_callback=log_to_file
+        )
+    except asyncio.CancelledError:
+        log_to_file("Scraping stopped by user.")
+    finally:
+        flusher.cancel()
+        log_fh.flush()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
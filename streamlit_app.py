@@ -2,18 +2,34 @@
 
 import streamlit as st
 import tempfile
+import io
+import csv
+from collections import deque
 import asyncio
 import os
+import re
 from pathlib import Path
 from datetime import datetime
 import subprocess
 import sys
 import pandas as pd
-from streamlit_autorefresh import st_autorefresh
+from openpyxl import load_workbook
 
 # Fixed output directory
 OUTPUT_DIR = "data/output"
 LOG_FILE = "data/output/scraper_log.txt"
+LOG_TAIL_LINES = 100
+# How long Stop waits for the scraper to flush and exit before killing it
+STOP_GRACE_SECONDS = 30
+# Most of a large catch-up read that is decoded/scanned for the tail and progress marker
+LOG_TAIL_BYTES = 1 << 20
+RUNNER_SCRIPT = str(Path(__file__).resolve().parent / "scraper_runner.py")
+
+# Log markers written by run_scraper(), matched against raw log bytes
+_RE_TOTAL = re.compile(rb"Loaded (\d+) RERA numbers")
+_RE_CURRENT = re.compile(rb"\[(\d+)/\d+\]")
+_SUCCESS_MARK = b"SUCCESS:"
+_ERROR_MARKS = (b"ERROR for", b"CAPTCHA failed")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 # Page config
@@ -25,7 +41,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     /* Main container */
     .main .block-container {
@@ -162,7 +178,9 @@ st.markdown("""
         background: linear-gradient(to right, transparent, #ddd, transparent);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 
 # -----------------------------
 # Session State Initialization
@@ -173,19 +191,50 @@ if "output_file_path" not in st.session_state:
     st.session_state.output_file_path = None
 if "process" not in st.session_state:
     st.session_state.process = None
-
-# -----------------------------
-# Auto-refresh when scraping is running
-# -----------------------------
-if st.session_state.is_running:
-    st_autorefresh(interval=2000, limit=None, key="log_refresh")
+if "log_offset" not in st.session_state:
+    st.session_state.log_offset = 0
+if "log_tail" not in st.session_state:
+    st.session_state.log_tail = deque(maxlen=LOG_TAIL_LINES)
+if "log_stats" not in st.session_state:
+    st.session_state.log_stats = {"success": 0, "error": 0, "total": 0, "current": 0, "has_data": False}
+
+def reset_log_tail():
+    """Forget what has been read from LOG_FILE so the next read starts from the top."""
+    st.session_state.log_offset = 0
+    st.session_state.log_tail = deque(maxlen=LOG_TAIL_LINES)
+    st.session_state.log_stats = {"success": 0, "error": 0, "total": 0, "current": 0, "has_data": False}
+
+def read_new_log_lines():
+    """Append lines written to LOG_FILE since the last call to the session log tail; returns the new bytes."""
+    if not os.path.exists(LOG_FILE):
+        return b""
+    with open(LOG_FILE, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() < st.session_state.log_offset:
+            # File was truncated or recreated
+            reset_log_tail()
+        f.seek(st.session_state.log_offset)
+        chunk = f.read()
+    # Only consume complete lines; a partially written one is picked up next time
+    end = chunk.rfind(b"\n") + 1
+    if not end:
+        return b""
+    st.session_state.log_offset += end
+    chunk = chunk[:end]
+    # Only the last LOG_TAIL_LINES are kept, so a large catch-up read (e.g. a
+    # fresh session on a long log) only decodes its last LOG_TAIL_BYTES
+    tail = chunk
+    if len(tail) > LOG_TAIL_BYTES:
+        tail = tail[-LOG_TAIL_BYTES:]
+        tail = tail[tail.find(b"\n") + 1:]
+    st.session_state.log_tail.extend(tail.decode("utf-8", "replace").splitlines())
+    return chunk
 
 # Check if process finished
 if st.session_state.is_running and st.session_state.process:
     poll = st.session_state.process.poll()
     if poll is not None:
-        st.session_state.is_running = False
-        st.session_state.process = None
+        st.session_state.update({"is_running": False, "process": None})
 
 # -----------------------------
 # Header
@@ -265,27 +314,63 @@ uploaded_file = st.file_uploader(
 
 st.markdown("### 📄 Output Settings")
 
+def _csv_rowcount(path):
+    """Count data rows in a CSV with csv.reader, so newlines inside quoted fields are not counted as records."""
+    with open(path, newline='', encoding='utf-8-sig', errors='replace', buffering=1 << 20) as f:
+        # Blank lines are skipped, as pandas did
+        records = sum(1 for row in csv.reader(f) if row)
+    return max(records - 1, 0)
+
+def _xlsx_rowcount(path):
+    """Count data rows in an XLSX from its sheet dimensions, in read-only mode."""
+    wb = load_workbook(path, read_only=True)
+    try:
+        return max((wb.worksheets[0].max_row or 1) - 1, 0)
+    finally:
+        wb.close()
+
+def _xlsx_head(source, n=5):
+    """First n data rows of an XLSX as a DataFrame, streamed in read-only mode."""
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(max_row=n + 1, values_only=True)
+        header = next(rows, None) or ()
+        # Blank header cells get pandas' read_excel names
+        columns = [str(h) if h is not None and str(h).strip() else f"Unnamed: {i}" for i, h in enumerate(header)]
+        return pd.DataFrame(list(rows), columns=columns or None)
+    finally:
+        wb.close()
+
+@st.cache_data(show_spinner=False, ttl=60)
+def count_output_records(path, mtime_ns, size):
+    """Record count of an output file. mtime/size are part of the cache key, so a changed file is re-counted."""
+    if path.endswith('.csv'):
+        return _csv_rowcount(path)
+    return _xlsx_rowcount(path)
+
 # Get existing output files
 def get_existing_output_files():
-    """Get list of existing CSV/XLSX files in output directory."""
+    """Get (name, size, records) for existing CSV/XLSX files in output directory; records is None if unreadable."""
     files = []
     if os.path.exists(OUTPUT_DIR):
-        for f in os.listdir(OUTPUT_DIR):
-            if f.endswith(('.csv', '.xlsx')) and not f.startswith('.'):
-                filepath = os.path.join(OUTPUT_DIR, f)
-                size = os.path.getsize(filepath)
-                try:
-                    if f.endswith('.csv'):
-                        df = pd.read_csv(filepath, nrows=0)
-                    else:
-                        df = pd.read_excel(filepath, nrows=0)
-                    records = len(pd.read_csv(filepath)) if f.endswith('.csv') else len(pd.read_excel(filepath))
-                    files.append(f"{f} ({records} records, {size:,} bytes)")
-                except:
-                    files.append(f"{f} ({size:,} bytes)")
+        with os.scandir(OUTPUT_DIR) as it:
+            for entry in it:
+                f = entry.name
+                if f.endswith(('.csv', '.xlsx')) and not f.startswith('.'):
+                    stat = entry.stat()
+                    size = stat.st_size
+                    try:
+                        records = count_output_records(entry.path, stat.st_mtime_ns, size)
+                    except:
+                        records = None
+                    files.append((f, size, records))
     return files
 
-existing_files = get_existing_output_files()
+def format_output_file(name, size, records):
+    """Selectbox label for an existing output file."""
+    if records is None:
+        return f"{name} ({size:,} bytes)"
+    return f"{name} ({records} records, {size:,} bytes)"
 
 col_mode, col_format = st.columns(2)
 
@@ -313,26 +398,22 @@ if output_mode == "Create New File":
         help="Name for the output file"
     )
 else:
+    existing_files = {name: (size, records) for name, size, records in get_existing_output_files()}
     if existing_files:
-        selected_file = st.selectbox(
+        # Options are bare filenames so the selection survives record counts changing
+        output_name = st.selectbox(
             "📂 Select Existing File to Continue",
-            options=existing_files,
+            options=list(existing_files),
+            format_func=lambda name: format_output_file(name, *existing_files[name]),
             help="Select an existing file to append new records to"
         )
-        # Extract just the filename from the selection
-        output_name = selected_file.split(" (")[0]
 
         # Show info about existing file
-        existing_path = os.path.join(OUTPUT_DIR, output_name)
-        if os.path.exists(existing_path):
-            try:
-                if output_name.endswith('.csv'):
-                    df_existing = pd.read_csv(existing_path)
-                else:
-                    df_existing = pd.read_excel(existing_path)
-                st.info(f"✅ Will continue from existing file with **{len(df_existing)}** records. Already processed RERA numbers will be skipped.")
-            except Exception as e:
-                st.warning(f"Could not read existing file: {e}")
+        records = existing_files[output_name][1]
+        if records is not None:
+            st.info(f"✅ Will continue from existing file with **{records}** records. Already processed RERA numbers will be skipped.")
+        else:
+            st.warning("Could not read existing file.")
     else:
         st.warning("No existing output files found. Please create a new file.")
         output_mode = "Create New File"
@@ -343,16 +424,21 @@ else:
             help="Name for the output file"
         )
 
+@st.cache_data(show_spinner=False)
+def preview_df(file_bytes, name):
+    """First 5 rows of an uploaded file, parsed once per distinct upload."""
+    if name.endswith('.csv'):
+        return pd.read_csv(io.BytesIO(file_bytes), nrows=5)
+    if name.endswith('.xlsx'):
+        return _xlsx_head(io.BytesIO(file_bytes))
+    return pd.read_excel(io.BytesIO(file_bytes), nrows=5)
+
 # Show file preview if uploaded
 if uploaded_file:
     with st.expander("👀 Preview Uploaded File", expanded=False):
         try:
-            if uploaded_file.name.endswith('.csv'):
-                df_preview = pd.read_csv(uploaded_file, nrows=5)
-            else:
-                df_preview = pd.read_excel(uploaded_file, nrows=5)
+            df_preview = preview_df(uploaded_file.getvalue(), uploaded_file.name)
             st.dataframe(df_preview, width="stretch")
-            uploaded_file.seek(0)  # Reset file pointer
             st.caption(f"Showing first 5 rows. Columns: {', '.join(df_preview.columns.tolist())}")
         except Exception as e:
             st.error(f"Could not preview file: {e}")
@@ -381,8 +467,14 @@ with col_btn2:
     )
 
 if stop_clicked and st.session_state.process:
+    # The runner turns SIGTERM into a clean shutdown that writes out buffered
+    # records and log lines; wait for that so the final stats are read
     st.session_state.process.terminate()
-    st.session_state.is_running = False
+    try:
+        st.session_state.process.wait(timeout=STOP_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        st.session_state.process.kill()
+    st.session_state.update({"is_running": False, "process": None})
     st.toast("Scraping stopped!", icon="⏹️")
     st.rerun()
 
@@ -390,117 +482,128 @@ if stop_clicked and st.session_state.process:
 # Stats Cards (Only show when scraping is active or has completed)
 # -----------------------------
 def parse_stats_from_log():
-    """Parse success/error counts from log file."""
-    stats = {"success": 0, "error": 0, "total": 0, "current": 0, "has_data": False}
-    if os.path.exists(LOG_FILE):
-        try:
-            with open(LOG_FILE, "r") as f:
-                content = f.read()
-
-                # Check if there's actual scraping data
-                if "Loaded" in content and "RERA numbers" in content:
-                    stats["has_data"] = True
-
-                # Count SUCCESS occurrences
-                stats["success"] = content.count("SUCCESS:")
-                stats["error"] = content.count("ERROR for") + content.count("CAPTCHA failed")
-
-                # Try to find total from "Loaded X RERA numbers"
-                import re
-                match = re.search(r"Loaded (\d+) RERA numbers", content)
-                if match:
-                    stats["total"] = int(match.group(1))
-
-                # Current progress
-                matches = re.findall(r"\[(\d+)/\d+\]", content)
-                if matches:
-                    stats["current"] = int(matches[-1])
-        except:
-            pass
+    """Update success/error counts from log lines written since the last call."""
+    stats = st.session_state.log_stats
+    try:
+        content = read_new_log_lines()
+    except:
+        return stats
+    if not content:
+        return stats
+
+    # Count SUCCESS occurrences
+    stats["success"] += content.count(_SUCCESS_MARK)
+    stats["error"] += sum(content.count(mark) for mark in _ERROR_MARKS)
+
+    # Total from "Loaded X RERA numbers" only needs to be found once
+    if not stats["has_data"]:
+        match = _RE_TOTAL.search(content)
+        if match:
+            stats["total"] = int(match.group(1))
+            stats["has_data"] = True
+
+    # Current progress is the last marker, which is nearly always in the tail
+    matches = _RE_CURRENT.findall(content[-LOG_TAIL_BYTES:]) or _RE_CURRENT.findall(content)
+    if matches:
+        stats["current"] = int(matches[-1])
     return stats
 
-stats = parse_stats_from_log()
-
-# Only show statistics if scraping is running or has data
-if st.session_state.is_running or stats["has_data"]:
-    st.markdown("### 📊 Statistics")
-
-    col_s1, col_s2, col_s3, col_s4 = st.columns(4)
-
-    with col_s1:
-        st.markdown(f"""
-        <div class="metric-card metric-card-success">
-            <p class="metric-value">{stats['success']}</p>
-            <p class="metric-label">✓ Successful</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col_s2:
-        st.markdown(f"""
-        <div class="metric-card metric-card-error">
-            <p class="metric-value">{stats['error']}</p>
-            <p class="metric-label">✗ Failed</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col_s3:
-        st.markdown(f"""
-        <div class="metric-card metric-card-total">
-            <p class="metric-value">{stats['total']}</p>
-            <p class="metric-label">📋 Total</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col_s4:
-        progress_pct = (stats['current'] / stats['total'] * 100) if stats['total'] > 0 else 0
-        st.markdown(f"""
-        <div class="metric-card">
-            <p class="metric-value">{progress_pct:.0f}%</p>
-            <p class="metric-label">📈 Progress</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Progress bar
-    if stats['total'] > 0:
-        st.progress(stats['current'] / stats['total'], text=f"Processing {stats['current']} of {stats['total']}")
-
-    st.markdown("---")
-
-# -----------------------------
-# Logs Section (Only show when scraping is active or has data)
-# -----------------------------
-if st.session_state.is_running or stats["has_data"]:
-    col_log_title, col_log_clear = st.columns([3, 1])
-
-    with col_log_title:
-        st.markdown("### 📝 Live Logs")
-
-    with col_log_clear:
-        if st.button("🗑️ Clear Logs", disabled=st.session_state.is_running):
-            if os.path.exists(LOG_FILE):
-                os.remove(LOG_FILE)
-            st.toast("Logs cleared!", icon="🗑️")
+def live_panel():
+    """Statistics and log tail; reruns on its own every 2s while scraping, without rerunning the page."""
+    # Once the scraper exits, rerun the whole app so the status badge and buttons update
+    if st.session_state.is_running and st.session_state.process:
+        if st.session_state.process.poll() is not None:
+            st.session_state.update({"is_running": False, "process": None})
             st.rerun()
 
-    log_placeholder = st.empty()
-
-    if os.path.exists(LOG_FILE):
-        with open(LOG_FILE, "r") as f:
-            logs = f.read()
-        if logs:
-            # Show last 100 lines
-            log_lines = logs.strip().split('\n')[-100:]
-            log_placeholder.code('\n'.join(log_lines), language="bash")
+    stats = parse_stats_from_log()
+
+    # Only show statistics if scraping is running or has data
+    if st.session_state.is_running or stats["has_data"]:
+        st.markdown("### 📊 Statistics")
+
+        col_s1, col_s2, col_s3, col_s4 = st.columns(4)
+
+        with col_s1:
+            st.markdown(f"""
+            <div class="metric-card metric-card-success">
+                <p class="metric-value">{stats['success']}</p>
+                <p class="metric-label">✓ Successful</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col_s2:
+            st.markdown(f"""
+            <div class="metric-card metric-card-error">
+                <p class="metric-value">{stats['error']}</p>
+                <p class="metric-label">✗ Failed</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col_s3:
+            st.markdown(f"""
+            <div class="metric-card metric-card-total">
+                <p class="metric-value">{stats['total']}</p>
+                <p class="metric-label">📋 Total</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col_s4:
+            progress_pct = (stats['current'] / stats['total'] * 100) if stats['total'] > 0 else 0
+            st.markdown(f"""
+            <div class="metric-card">
+                <p class="metric-value">{progress_pct:.0f}%</p>
+                <p class="metric-label">📈 Progress</p>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Progress bar
+        if stats['total'] > 0:
+            st.progress(stats['current'] / stats['total'], text=f"Processing {stats['current']} of {stats['total']}")
+
+        st.markdown("---")
+
+    # Logs Section (Only show when scraping is active or has data)
+    if st.session_state.is_running or stats["has_data"]:
+        col_log_title, col_log_clear = st.columns([3, 1])
+
+        with col_log_title:
+            st.markdown("### 📝 Live Logs")
+
+        with col_log_clear:
+            if st.button("🗑️ Clear Logs", disabled=st.session_state.is_running):
+                if os.path.exists(LOG_FILE):
+                    os.remove(LOG_FILE)
+                reset_log_tail()
+                st.toast("Logs cleared!", icon="🗑️")
+                st.rerun()
+
+        log_placeholder = st.empty()
+
+        if os.path.exists(LOG_FILE):
+            # parse_stats_from_log() above has already pulled in any new lines
+            if st.session_state.log_tail:
+                # Show last LOG_TAIL_LINES lines
+                log_placeholder.code('\n'.join(st.session_state.log_tail), language="bash")
+            else:
+                log_placeholder.info("Waiting for logs...")
         else:
-            log_placeholder.info("Waiting for logs...")
-    else:
-        log_placeholder.info("📋 Logs will appear here when scraping starts...")
+            log_placeholder.info("📋 Logs will appear here when scraping starts...")
 
-    st.markdown("---")
+        st.markdown("---")
+
+st.fragment(run_every="2s" if st.session_state.is_running else None)(live_panel)()
 
 # -----------------------------
 # Download Section
 # -----------------------------
+@st.cache_data(show_spinner=False, max_entries=8)
+def output_preview_df(path, mtime_ns):
+    """First 5 rows of the output file; mtime keys the cache so new records show up."""
+    if path.endswith('.xlsx'):
+        return _xlsx_head(path)
+    return pd.read_csv(path, nrows=5)
+
 if st.session_state.output_file_path and os.path.exists(st.session_state.output_file_path):
     file_size = os.path.getsize(st.session_state.output_file_path)
     if file_size > 0:
@@ -513,10 +616,10 @@ if st.session_state.output_file_path and os.path.exists(st.session_state.output_
         with col_dl1:
             # Show preview of output
             try:
-                if is_xlsx:
-                    df_output = pd.read_excel(st.session_state.output_file_path, nrows=5)
-                else:
-                    df_output = pd.read_csv(st.session_state.output_file_path, nrows=5)
+                df_output = output_preview_df(
+                    st.session_state.output_file_path,
+                    os.stat(st.session_state.output_file_path).st_mtime_ns
+                )
                 st.dataframe(df_output, width="stretch")
                 st.caption(f"Preview of output file ({file_size:,} bytes)")
             except:
@@ -560,13 +663,11 @@ if start_clicked:
     with open(input_path, "wb") as f:
         f.write(uploaded_file.getbuffer())
 
-    st.session_state.output_file_path = str(output_path)
-    st.session_state.is_running = True
-
     # Check if continuing from existing file
     is_continuing = output_mode == "Continue Existing File" and os.path.exists(output_path)
 
     # Clear old log file
+    reset_log_tail()
     with open(LOG_FILE, "w") as f:
         f.write(f"{'='*50}\n")
         f.write(f"  MahaRERA Scraper Started\n")
@@ -584,39 +685,28 @@ if start_clicked:
 
     # Run scraper as subprocess
     cmd = [
-        sys.executable, "-c", f"""
-import asyncio
-import sys
-sys.path.insert(0, '.')
-from scraper import run_scraper
-
-def log_to_file(msg):
-    with open('{LOG_FILE}', 'a') as f:
-        f.write(msg + '\\n')
-        f.flush()
-    print(msg)
-
-asyncio.run(run_scraper(
-    input_path='{input_path}',
-    output_path='{output_path}',
-    start_row={start_row},
-    headless=False,
-    max_captcha_attempts={max_captcha_attempts},
-    rera_column='{rera_column}',
-    log_callback=log_to_file
-))
-"""
+        sys.executable, RUNNER_SCRIPT,
+        "--input", str(input_path),
+        "--output", str(output_path),
+        "--log-file", LOG_FILE,
+        "--start-row", str(start_row),
+        "--max-captcha-attempts", str(max_captcha_attempts),
+        "--rera-column", rera_column,
     ]
 
-    # Start subprocess
-    process = subprocess.Popen(
-        cmd,
-        cwd=os.getcwd(),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True
-    )
-    st.session_state.process = process
+    # Start subprocess; progress goes to LOG_FILE, and so does any crash traceback
+    with open(LOG_FILE, "a") as stderr_log:
+        process = subprocess.Popen(
+            cmd,
+            cwd=os.getcwd(),
+            stdout=subprocess.DEVNULL,
+            stderr=stderr_log
+        )
+    st.session_state.update({
+        "output_file_path": str(output_path),
+        "is_running": True,
+        "process": process,
+    })
 
     st.toast("Scraper started!", icon="🚀")
     st.rerun()